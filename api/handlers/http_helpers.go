@@ -3,12 +3,30 @@ package handlers
 import (
 	"encoding/json"
 	"net/http"
+	"strconv"
+
+	"github.com/AnalyseDeCircuit/opskernel/internal/utils"
 )
 
+// encodeErrorBody 是编码失败时返回的固定响应体
+const encodeErrorBody = `{"error":"Failed to encode response"}`
+
+// writeJSON 先完整编码再写出：编码失败时还能返回 500，而不是半截响应；
+// 已知长度时设置 Content-Length，net/http 无需再做分块传输编码。
+// 响应中可能包含日志、错误信息等任意文本，因此保留 HTML 转义。
 func writeJSON(w http.ResponseWriter, status int, body interface{}) {
+	data, err := utils.MarshalJSONEscaped(body)
+	if err != nil {
+		w.Header().Set("Content-Type", "application/json")
+		w.Header().Set("Content-Length", strconv.Itoa(len(encodeErrorBody)))
+		w.WriteHeader(http.StatusInternalServerError)
+		_, _ = w.Write([]byte(encodeErrorBody))
+		return
+	}
 	w.Header().Set("Content-Type", "application/json")
+	w.Header().Set("Content-Length", strconv.Itoa(len(data)))
 	w.WriteHeader(status)
-	_ = json.NewEncoder(w).Encode(body)
+	_, _ = w.Write(data)
 }
 
 func writeJSONError(w http.ResponseWriter, status int, message string) {
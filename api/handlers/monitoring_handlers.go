@@ -7,6 +7,7 @@ import (
 	"net/http"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/AnalyseDeCircuit/opskernel/internal/auth"
@@ -41,55 +42,78 @@ func SystemInfoHandler(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	// 各数据源彼此独立，并行获取：请求耗时取决于最慢的一项，而不是各项之和
+	var (
+		wg         sync.WaitGroup
+		metrics    *types.SystemMetrics
+		metricsErr error
+		containers []types.DockerContainer
+		dockerErr  error
+		services   []types.ServiceInfo
+		systemdErr error
+		sshStats   types.SSHStats
+		netInfo    types.NetInfo
+		netErr     error
+		powerInfo  *types.PowerInfo
+		powerErr   error
+	)
+	run := func(f func()) {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			f()
+		}()
+	}
+	run(func() { metrics, metricsErr = monitoring.GlobalMonitoringService.GetSystemMetrics() })
+	run(func() { containers, dockerErr = docker.ListContainers() })
+	run(func() { services, systemdErr = systemd.ListServices() })
+	run(func() { sshStats = network.GetSSHStats() })
+	run(func() { netInfo, netErr = network.GetNetworkInfo() })
+	run(func() { powerInfo, powerErr = power.GetPowerInfo() })
+	wg.Wait()
+
 	response := map[string]interface{}{}
 
-	// 获取系统指标（直接调用，不超时）
-	metrics, err := monitoring.GlobalMonitoringService.GetSystemMetrics()
-	if err != nil {
-		response["system_metrics_error"] = err.Error()
+	// 系统指标
+	if metricsErr != nil {
+		response["system_metrics_error"] = metricsErr.Error()
 		response["system_metrics"] = &types.SystemMetrics{}
 	} else {
 		response["system_metrics"] = metrics
 	}
 
-	// 获取Docker容器
-	containers, err := docker.ListContainers()
-	if err != nil {
-		response["docker_error"] = err.Error()
+	// Docker容器
+	if dockerErr != nil {
+		response["docker_error"] = dockerErr.Error()
 		containers = []types.DockerContainer{}
 	}
 	response["docker"] = map[string]interface{}{
 		"containers": containers,
 	}
 
-	// 获取Systemd服务
-	services, err := systemd.ListServices()
-	if err != nil {
-		response["systemd_error"] = err.Error()
+	// Systemd服务
+	if systemdErr != nil {
+		response["systemd_error"] = systemdErr.Error()
 		services = []types.ServiceInfo{}
 	}
 	response["systemd"] = map[string]interface{}{
 		"services": services,
 	}
 
-	// 获取网络信息
-	// 尝试获取 SSH 统计信息
-	sshStats := network.GetSSHStats()
+	// SSH 统计信息
 	response["ssh_stats"] = sshStats
 
-	// 获取网络信息
-	netInfo, err := network.GetNetworkInfo()
-	if err != nil {
-		response["network_error"] = err.Error()
+	// 网络信息
+	if netErr != nil {
+		response["network_error"] = netErr.Error()
 		response["network"] = types.NetInfo{}
 	} else {
 		response["network"] = netInfo
 	}
 
-	// 获取电源信息
-	powerInfo, err := power.GetPowerInfo()
-	if err != nil {
-		response["power_error"] = err.Error()
+	// 电源信息
+	if powerErr != nil {
+		response["power_error"] = powerErr.Error()
 		powerInfo = &types.PowerInfo{}
 	}
 	response["power"] = powerInfo
@@ -99,8 +123,7 @@ func SystemInfoHandler(w http.ResponseWriter, r *http.Request) {
 		"size": cache.GlobalMetricsCache.Size(),
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(response)
+	writeJSON(w, http.StatusOK, response)
 }
 
 // DockerContainersHandler 处理Docker容器请求
@@ -125,8 +148,7 @@ func DockerContainersHandler(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(map[string]interface{}{
+	writeJSON(w, http.StatusOK, map[string]interface{}{
 		"containers": containers,
 	})
 }
@@ -143,8 +165,7 @@ func DockerImagesHandler(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(map[string]interface{}{
+	writeJSON(w, http.StatusOK, map[string]interface{}{
 		"images": images,
 	})
 }
@@ -157,17 +178,13 @@ func DockerActionHandler(w http.ResponseWriter, r *http.Request) {
 
 	username, role, err := getUserAndRoleFromRequest(r)
 	if err != nil {
-		w.Header().Set("Content-Type", "application/json")
-		w.WriteHeader(http.StatusUnauthorized)
-		json.NewEncoder(w).Encode(map[string]string{
+		writeJSON(w, http.StatusUnauthorized, map[string]string{
 			"error": "Unauthorized",
 		})
 		return
 	}
 	if role != "admin" {
-		w.Header().Set("Content-Type", "application/json")
-		w.WriteHeader(http.StatusForbidden)
-		json.NewEncoder(w).Encode(map[string]string{
+		writeJSON(w, http.StatusForbidden, map[string]string{
 			"error": "Forbidden: Admin access required",
 		})
 		return
@@ -191,8 +208,7 @@ func DockerActionHandler(w http.ResponseWriter, r *http.Request) {
 	// 记录操作日志
 	logs.LogOperation(username, "docker_action", fmt.Sprintf("%s %s", request.Action, request.ID), r.RemoteAddr)
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(map[string]string{
+	writeJSON(w, http.StatusOK, map[string]string{
 		"status":  "success",
 		"message": "Docker action completed",
 	})
@@ -235,8 +251,7 @@ func DockerLogsHandler(w http.ResponseWriter, r *http.Request) {
 
 	logs.LogOperation(username, "docker_logs", fmt.Sprintf("fetch logs tail=%d for %s", tail, containerID), r.RemoteAddr)
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(map[string]string{
+	writeJSON(w, http.StatusOK, map[string]string{
 		"logs": logsText,
 	})
 }
@@ -261,8 +276,7 @@ func DockerPruneHandler(w http.ResponseWriter, r *http.Request) {
 	// 记录操作日志
 	logs.LogOperation(username, "docker_prune", "Pruned unused Docker resources", r.RemoteAddr)
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(map[string]interface{}{
+	writeJSON(w, http.StatusOK, map[string]interface{}{
 		"status":  "success",
 		"message": "Docker prune completed",
 		"result":  result,
@@ -334,8 +348,7 @@ func SystemdServicesHandler(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(services)
+	writeJSON(w, http.StatusOK, services)
 }
 
 // SystemdActionHandler 处理 Systemd 服务操作请求
@@ -346,17 +359,13 @@ func SystemdActionHandler(w http.ResponseWriter, r *http.Request) {
 
 	username, role, err := getUserAndRoleFromRequest(r)
 	if err != nil {
-		w.Header().Set("Content-Type", "application/json")
-		w.WriteHeader(http.StatusUnauthorized)
-		json.NewEncoder(w).Encode(map[string]string{
+		writeJSON(w, http.StatusUnauthorized, map[string]string{
 			"error": "Unauthorized",
 		})
 		return
 	}
 	if role != "admin" {
-		w.Header().Set("Content-Type", "application/json")
-		w.WriteHeader(http.StatusForbidden)
-		json.NewEncoder(w).Encode(map[string]string{
+		writeJSON(w, http.StatusForbidden, map[string]string{
 			"error": "Forbidden: Admin access required",
 		})
 		return
@@ -392,8 +401,7 @@ func SystemdActionHandler(w http.ResponseWriter, r *http.Request) {
 	// 记录操作日志
 	logs.LogOperation(username, "systemd_action", fmt.Sprintf("%s %s", req.Action, req.Unit), r.RemoteAddr)
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(map[string]string{"status": "success"})
+	writeJSON(w, http.StatusOK, map[string]string{"status": "success"})
 }
 
 // NetworkInfoHandler 处理网络信息请求
@@ -415,8 +423,7 @@ func NetworkInfoHandler(w http.ResponseWriter, r *http.Request) {
 		"timestamp":  time.Now().Format(time.RFC3339),
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(info)
+	writeJSON(w, http.StatusOK, info)
 }
 
 // PowerInfoHandler 处理电源信息请求
@@ -431,8 +438,7 @@ func PowerInfoHandler(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(info)
+	writeJSON(w, http.StatusOK, info)
 }
 
 // PrometheusMetricsHandler 处理Prometheus指标请求
@@ -468,8 +474,7 @@ func CacheInfoHandler(w http.ResponseWriter, r *http.Request) {
 		"stats": "Cache system is operational",
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(info)
+	writeJSON(w, http.StatusOK, info)
 }
 
 // HealthCheckHandler 处理健康检查请求
@@ -533,8 +538,7 @@ func PowerActionHandler(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(result)
+	writeJSON(w, http.StatusOK, result)
 }
 
 // ShutdownStatusHandler 处理关机状态请求
@@ -549,8 +553,7 @@ func ShutdownStatusHandler(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(status)
+	writeJSON(w, http.StatusOK, status)
 }
 
 // getUserAndRoleFromRequest 从请求中解析JWT并返回用户名和角色
@@ -596,22 +599,17 @@ func CronLegacyHandler(w http.ResponseWriter, r *http.Request) {
 			return
 		}
 
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(jobs)
+		writeJSON(w, http.StatusOK, jobs)
 	case http.MethodPost:
 		username, role, err := getUserAndRoleFromRequest(r)
 		if err != nil {
-			w.Header().Set("Content-Type", "application/json")
-			w.WriteHeader(http.StatusUnauthorized)
-			json.NewEncoder(w).Encode(map[string]string{
+			writeJSON(w, http.StatusUnauthorized, map[string]string{
 				"error": "Unauthorized",
 			})
 			return
 		}
 		if role != "admin" {
-			w.Header().Set("Content-Type", "application/json")
-			w.WriteHeader(http.StatusForbidden)
-			json.NewEncoder(w).Encode(map[string]string{
+			writeJSON(w, http.StatusForbidden, map[string]string{
 				"error": "Forbidden: Admin access required",
 			})
 			return
@@ -631,8 +629,7 @@ func CronLegacyHandler(w http.ResponseWriter, r *http.Request) {
 		// 记录操作日志
 		logs.LogOperation(username, "cron_update", "Updated crontab", r.RemoteAddr)
 
-		w.Header().Set("Content-Type", "application/json")
-		json.NewEncoder(w).Encode(map[string]string{
+		writeJSON(w, http.StatusOK, map[string]string{
 			"status": "success",
 		})
 	default:
@@ -652,8 +649,7 @@ func CronJobsHandler(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(jobs)
+	writeJSON(w, http.StatusOK, jobs)
 }
 
 // CronActionHandler 处理Cron操作请求
@@ -699,8 +695,7 @@ func CronActionHandler(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(map[string]string{
+	writeJSON(w, http.StatusOK, map[string]string{
 		"status":  "success",
 		"message": "Cron action completed",
 	})
@@ -741,6 +736,5 @@ func StaticInfoHandler(w http.ResponseWriter, r *http.Request) {
 
 	info := system.GetStaticInfo()
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(info)
+	writeJSON(w, http.StatusOK, info)
 }
@@ -13,6 +13,7 @@ import (
 	"time"
 
 	"github.com/AnalyseDeCircuit/opskernel/internal/logs"
+	"github.com/AnalyseDeCircuit/opskernel/internal/utils"
 	"github.com/shirou/gopsutil/v3/process"
 )
 
@@ -44,31 +45,23 @@ func ProcessIOHandler(w http.ResponseWriter, r *http.Request) {
 	ioRead := "-"
 	ioWrite := "-"
 	if ioCounters, err := proc.IOCounters(); err == nil {
-		ioRead = formatSize(ioCounters.ReadBytes)
-		ioWrite = formatSize(ioCounters.WriteBytes)
+		ioRead = utils.GetSize(ioCounters.ReadBytes)
+		ioWrite = utils.GetSize(ioCounters.WriteBytes)
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(map[string]string{
+	// cwd 不再随进程列表每轮采集，只在查看详情时读取
+	cwd, _ := proc.Cwd()
+	if cwd == "" {
+		cwd = "-"
+	}
+
+	writeJSON(w, http.StatusOK, map[string]string{
 		"io_read":  ioRead,
 		"io_write": ioWrite,
+		"cwd":      cwd,
 	})
 }
 
-// formatSize converts bytes to human-readable format
-func formatSize(bytes uint64) string {
-	const unit = 1024
-	if bytes < unit {
-		return fmt.Sprintf("%d B", bytes)
-	}
-	div, exp := uint64(unit), 0
-	for n := bytes / unit; n >= unit; n /= unit {
-		div *= unit
-		exp++
-	}
-	return fmt.Sprintf("%.2f %ciB", float64(bytes)/float64(div), "KMGTPE"[exp])
-}
-
 // ProcessKillHandler 终止指定 PID 的进程（仅管理员）
 // POST /api/process/kill {"pid":1234}
 func ProcessKillHandler(w http.ResponseWriter, r *http.Request) {
@@ -210,8 +203,7 @@ func ProcessKillHandler(w http.ResponseWriter, r *http.Request) {
 
 	logs.LogOperation(username, "kill_process", logMsg, r.RemoteAddr)
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(map[string]interface{}{
+	writeJSON(w, http.StatusOK, map[string]interface{}{
 		"status": "success",
 		"pid":    req.PID,
 		"name":   procName,
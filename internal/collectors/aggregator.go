@@ -9,6 +9,7 @@ import (
 
 	"github.com/AnalyseDeCircuit/opskernel/internal/config"
 	"github.com/AnalyseDeCircuit/opskernel/internal/monitoring"
+	"github.com/AnalyseDeCircuit/opskernel/internal/utils"
 	"github.com/AnalyseDeCircuit/opskernel/pkg/types"
 )
 
@@ -73,10 +74,14 @@ func NewStreamingAggregator() *StreamingAggregator {
 	return a
 }
 
+// minCollectInterval 是采集间隔的下限，与调用方传入的值无关，
+// 保证 /proc 读取频率有上界
+const minCollectInterval = time.Second
+
 // SetInterval changes the collection interval dynamically
 func (a *StreamingAggregator) SetInterval(d time.Duration) {
-	if d < time.Second {
-		d = time.Second
+	if d < minCollectInterval {
+		d = minCollectInterval
 	}
 	a.interval.Store(d.Milliseconds())
 }
@@ -105,7 +110,7 @@ func (a *StreamingAggregator) Start() {
 	// Fast collectors: CPU, Memory, Network (core metrics)
 	// Slow collectors: Disk, Sensors, GPU, SSH, System
 	collectors := []collectorDef{
-		{"cpu", cfg.EnableCPU, a.cpu.Collect, &a.cpuData, 0},
+		{"cpu", cfg.EnableCPU, a.collectCPU, &a.cpuData, 0},
 		{"memory", cfg.EnableMemory, a.memory.Collect, &a.memoryData, 0},
 		{"network", cfg.EnableNetwork, a.network.Collect, &a.networkData, 0},
 		{"disk", cfg.EnableDisk, a.disk.Collect, &a.diskData, 2 * time.Second},             // slower
@@ -123,37 +128,63 @@ func (a *StreamingAggregator) Start() {
 		a.wg.Add(1)
 		go a.runCollector(c.name, c.collect, c.store, c.interval)
 	}
+
+	// Power is sampled continuously in the background so RAPL counter wraps are
+	// never missed; the power collector above only publishes the latest sample.
+	if cfg.EnablePower {
+		a.wg.Add(1)
+		go func() {
+			defer a.wg.Done()
+			a.power.RunSampler(a.ctx)
+		}()
+	}
 }
 
 func (a *StreamingAggregator) runCollector(name string, collect func(context.Context) interface{}, store *ModuleData, customInterval time.Duration) {
 	defer a.wg.Done()
 
-	// Collect immediately on start
-	ctx, cancel := context.WithTimeout(a.ctx, 8*time.Second)
-	data := collect(ctx)
-	cancel()
-	if data != nil {
-		store.Store(data)
-	}
+	// 按截止时间调度：下一次采集时间 = 上一次计划时间 + interval，
+	// 而不是"采集完成后再等 interval"，采集耗时不会累积成漂移。
+	// 落后超过一个周期时（采集过慢或系统挂起）直接从当前时间重新对齐，不补采。
+	var timer *time.Timer
+	defer func() {
+		if timer != nil {
+			timer.Stop()
+		}
+	}()
 
+	next := time.Now()
 	for {
+		// Collect immediately on start, then on each deadline
+		ctx, cancel := context.WithTimeout(a.ctx, 8*time.Second)
+		data := collect(ctx)
+		cancel()
+		if data != nil {
+			store.Store(data)
+		}
+
 		// Determine interval
 		interval := time.Duration(a.interval.Load()) * time.Millisecond
 		if customInterval > 0 && customInterval > interval {
 			interval = customInterval
 		}
 
+		next = next.Add(interval)
+		now := time.Now()
+		if next.Before(now) {
+			next = now.Add(interval)
+		}
+		if timer == nil {
+			timer = time.NewTimer(next.Sub(now))
+		} else {
+			timer.Reset(next.Sub(now)) // 上一次已从 timer.C 收到，可以安全 Reset
+		}
+
 		select {
 		case <-a.ctx.Done():
 			log.Printf("collector %s: shutting down", name)
 			return
-		case <-time.After(interval):
-			ctx, cancel := context.WithTimeout(a.ctx, 8*time.Second)
-			data := collect(ctx)
-			cancel()
-			if data != nil {
-				store.Store(data)
-			}
+		case <-timer.C:
 		}
 	}
 }
@@ -172,6 +203,10 @@ func (a *StreamingAggregator) Stop() {
 	a.mu.Unlock()
 
 	a.wg.Wait()
+
+	// 释放采集期间保持打开的 /proc、/sys 句柄
+	utils.ProcFiles.Close()
+	a.sensors.Close()
 }
 
 // GetLatestStats merges all latest module data into a single Response
@@ -181,6 +216,8 @@ func (a *StreamingAggregator) GetLatestStats() types.Response {
 
 	// Initialize all fields to avoid null in JSON
 	resp.Fans = []interface{}{}
+	resp.CPU.TempHistory = []float64{}
+	resp.CPU.PercentHistory = []float64{}
 	resp.Disk = []types.DiskInfo{}
 	resp.DiskIO = map[string]types.DiskIOInfo{}
 	resp.Inodes = []types.InodeInfo{}
@@ -205,6 +242,8 @@ func (a *StreamingAggregator) GetLatestStats() types.Response {
 			resp.CPU.Info = cpuData.Info
 			resp.CPU.LoadAvg = cpuData.LoadAvg
 			resp.CPU.Freq = cpuData.Freq
+			resp.CPU.TempHistory = cpuData.TempHistory
+			resp.CPU.PercentHistory = cpuData.PercentHistory
 		}
 	}
 
@@ -266,25 +305,44 @@ func (a *StreamingAggregator) GetLatestStats() types.Response {
 		}
 	}
 
+	return resp
+}
+
+// collectCPU 采集 CPU 数据，并在采集协程中推进历史记录和检查告警。
+// 这些有副作用的操作放在这里，而不是放在 GetLatestStats 中：读取路径会被每个
+// 客户端/每次推送并发调用，历史应当按采样推进而不是按读取推进，告警状态也只应由
+// 单个协程更新。
+func (a *StreamingAggregator) collectCPU(ctx context.Context) interface{} {
+	data, ok := a.cpu.Collect(ctx).(CPUData)
+	if !ok {
+		return nil
+	}
+
 	// Update temperature history
-	currentTemp := extractAvgTemp(resp.Sensors)
-	resp.CPU.TempHistory = a.cpu.UpdateTempHistory(currentTemp)
+	data.TempHistory = a.cpu.UpdateTempHistory(extractAvgTemp(a.sensorsData.Load()))
 
 	// Update CPU percent history
-	resp.CPU.PercentHistory = a.cpu.UpdatePercentHistory(resp.CPU.Percent)
+	data.PercentHistory = a.cpu.UpdatePercentHistory(data.Percent)
+
+	var memPercent float64
+	if memData, ok := a.memoryData.Load().(MemoryData); ok {
+		memPercent = memData.Memory.Percent
+	}
 
 	// Calculate max disk usage for alerts
 	maxDisk := 0.0
-	for _, d := range resp.Disk {
-		if d.Percent > maxDisk {
-			maxDisk = d.Percent
+	if diskData, ok := a.diskData.Load().(DiskData); ok {
+		for _, d := range diskData.Disks {
+			if d.Percent > maxDisk {
+				maxDisk = d.Percent
+			}
 		}
 	}
 
 	// Check alerts
-	monitoring.CheckAlerts(resp.CPU.Percent, resp.Memory.Percent, maxDisk)
+	monitoring.CheckAlerts(data.Percent, memPercent, maxDisk)
 
-	return resp
+	return data
 }
 
 // extractAvgTemp extracts average temperature from sensors data
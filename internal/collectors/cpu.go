@@ -1,13 +1,14 @@
 package collectors
 
 import (
-	"bufio"
+	"bytes"
 	"context"
-	"os"
+	"math"
+	"path/filepath"
 	"runtime"
 	"strconv"
-	"strings"
 	"sync"
+	"time"
 
 	"github.com/AnalyseDeCircuit/opskernel/internal/config"
 	"github.com/AnalyseDeCircuit/opskernel/internal/utils"
@@ -21,8 +22,28 @@ type CPUCollector struct {
 	tempHistory    []float64
 	percentHistory []float64
 	historyMu      sync.Mutex
+
+	// 上一次 /proc/stat 快照：下标 0 为汇总行 "cpu"，其后为 cpu0..cpuN
+	lastTimes []cpuTimes
+	statMu    sync.Mutex
+
+	// 频率变化较慢，缓存 cpuFreqTTL
+	freqCache     types.CPUFreq
+	freqUpdatedAt time.Time
+
+	// 型号与核心数在运行期间不变，只解析一次 cpuinfo
+	infoOnce sync.Once
+	info     types.CPUDetail
 }
 
+// cpuTimes 是 /proc/stat 中一行 cpu 的累计 jiffies
+type cpuTimes struct {
+	total uint64 // user+nice+system+idle+iowait+irq+softirq+steal（guest 已包含在 user/nice 中）
+	busy  uint64 // total - idle - iowait
+}
+
+const cpuFreqTTL = 5 * time.Second
+
 // CPUData 包含 CPU 采集结果
 type CPUData struct {
 	Percent        float64
@@ -49,18 +70,8 @@ func (c *CPUCollector) Name() string {
 func (c *CPUCollector) Collect(ctx context.Context) interface{} {
 	data := CPUData{}
 
-	// CPU Percent (overall)
-	cpuPercent, _ := cpu.Percent(0, false)
-	if len(cpuPercent) > 0 {
-		data.Percent = utils.Round(cpuPercent[0])
-	}
-
-	// Per-core percent
-	perCore, _ := cpu.Percent(0, true)
-	data.PerCore = make([]float64, len(perCore))
-	for i, v := range perCore {
-		data.PerCore[i] = utils.Round(v)
-	}
+	// CPU percent (overall + per-core) from a single /proc/stat read
+	data.Percent, data.PerCore = c.cpuPercents()
 
 	// CPU Info
 	data.Info = c.getCPUInfo()
@@ -80,6 +91,97 @@ func (c *CPUCollector) Collect(ctx context.Context) interface{} {
 	return data
 }
 
+// cpuPercents 读取一次 /proc/stat，与上一次快照求差得到总体与各核心使用率，
+// 取代分别调用 cpu.Percent(0, false) 与 cpu.Percent(0, true) 的两次读取。
+// 计算方式与 gopsutil 一致；首次调用时以开机以来的累计值计算。
+func (c *CPUCollector) cpuPercents() (float64, []float64) {
+	times, err := readCPUTimes()
+	if err != nil || len(times) == 0 {
+		// 无法读取 /proc/stat 时回退到 gopsutil，同样只取一次各核心时间
+		times, err = gopsutilCPUTimes()
+		if err != nil || len(times) == 0 {
+			return 0, []float64{}
+		}
+	}
+
+	c.statMu.Lock()
+	last := c.lastTimes
+	c.lastTimes = times
+	c.statMu.Unlock()
+
+	if len(last) != len(times) {
+		// 首次采集或 CPU 热插拔：以零值为基准（即开机以来的平均值）
+		last = make([]cpuTimes, len(times))
+	}
+
+	overall := utils.Round(cpuBusyPercent(last[0], times[0]))
+	perCore := make([]float64, len(times)-1)
+	for i := range perCore {
+		perCore[i] = utils.Round(cpuBusyPercent(last[i+1], times[i+1]))
+	}
+	return overall, perCore
+}
+
+func cpuBusyPercent(prev, cur cpuTimes) float64 {
+	if cur.busy <= prev.busy {
+		return 0
+	}
+	if cur.total <= prev.total {
+		return 100
+	}
+	return math.Min(100, float64(cur.busy-prev.busy)/float64(cur.total-prev.total)*100)
+}
+
+// readCPUTimes 解析 /proc/stat 开头的 cpu 行
+func readCPUTimes() ([]cpuTimes, error) {
+	var times []cpuTimes
+	err := utils.ProcFiles.Read(filepath.Join(hostProcRoot(), "stat"), 16<<10, func(data []byte) error {
+		for len(data) > 0 {
+			var line []byte
+			line, data = nextLine(data)
+			if !bytes.HasPrefix(line, []byte("cpu")) {
+				// cpu 行总是位于文件开头且连续
+				break
+			}
+			fields := bytes.Fields(line)
+			var total, idle uint64
+			for i := 1; i < len(fields) && i <= 8; i++ {
+				v, _ := strconv.ParseUint(string(fields[i]), 10, 64)
+				total += v
+				if i == 4 || i == 5 { // idle, iowait
+					idle += v
+				}
+			}
+			times = append(times, cpuTimes{total: total, busy: total - idle})
+		}
+		return nil
+	})
+	return times, err
+}
+
+// gopsutilCPUTimes 通过一次 cpu.Times(true) 获取各核心时间，并求和得到总体时间，
+// 返回与 readCPUTimes 相同的布局（下标 0 为总体）。
+// 不再分别调用 cpu.Percent(0, false) 与 cpu.Percent(0, true)，避免两次读取内核统计。
+func gopsutilCPUTimes() ([]cpuTimes, error) {
+	stats, err := cpu.Times(true)
+	if err != nil {
+		return nil, err
+	}
+	times := make([]cpuTimes, len(stats)+1)
+	for i, st := range stats {
+		total := st.User + st.Nice + st.System + st.Idle + st.Iowait + st.Irq + st.Softirq + st.Steal
+		// gopsutil 以秒为单位，换算为 USER_HZ 刻度以便沿用整数差分
+		t := cpuTimes{
+			total: uint64(total * 100),
+			busy:  uint64((total - st.Idle - st.Iowait) * 100),
+		}
+		times[i+1] = t
+		times[0].total += t.total
+		times[0].busy += t.busy
+	}
+	return times, nil
+}
+
 // UpdateTempHistory 更新温度历史记录
 func (c *CPUCollector) UpdateTempHistory(currentTemp float64) []float64 {
 	c.historyMu.Lock()
@@ -112,7 +214,15 @@ func (c *CPUCollector) UpdatePercentHistory(percent float64) []float64 {
 	return result
 }
 
+// getCPUInfo 返回 CPU 静态信息，首次调用时读取并缓存
 func (c *CPUCollector) getCPUInfo() types.CPUDetail {
+	c.infoOnce.Do(func() {
+		c.info = readCPUDetail()
+	})
+	return c.info
+}
+
+func readCPUDetail() types.CPUDetail {
 	info := types.CPUDetail{
 		Model:        "Unknown",
 		Architecture: runtime.GOARCH,
@@ -125,56 +235,53 @@ func (c *CPUCollector) getCPUInfo() types.CPUDetail {
 	info.Cores, _ = cpu.Counts(false)
 	info.Threads, _ = cpu.Counts(true)
 
-	paths := []string{config.HostPath("/proc/cpuinfo"), "/proc/cpuinfo"}
-	for _, path := range paths {
-		if file, err := os.Open(path); err == nil {
-			scanner := bufio.NewScanner(file)
-			for scanner.Scan() {
-				line := scanner.Text()
-				if strings.HasPrefix(line, "model name") {
-					parts := strings.Split(line, ":")
-					if len(parts) > 1 {
-						info.Model = strings.TrimSpace(parts[1])
-						file.Close()
-						return info
-					}
+	if data, ok := readCPUInfo(); ok {
+		for len(data) > 0 {
+			var line []byte
+			line, data = nextLine(data)
+			if bytes.HasPrefix(line, []byte("model name")) {
+				if idx := bytes.IndexByte(line, ':'); idx >= 0 {
+					info.Model = string(bytes.TrimSpace(line[idx+1:]))
+					return info
 				}
 			}
-			file.Close()
-			break
 		}
 	}
 
 	return info
 }
 
+// getCPUFreq 返回 CPU 频率，结果缓存 cpuFreqTTL
 func (c *CPUCollector) getCPUFreq() types.CPUFreq {
+	c.statMu.Lock()
+	defer c.statMu.Unlock()
+	if !c.freqUpdatedAt.IsZero() && time.Since(c.freqUpdatedAt) < cpuFreqTTL {
+		return c.freqCache
+	}
+	c.freqCache = readCPUFreq()
+	c.freqUpdatedAt = time.Now()
+	return c.freqCache
+}
+
+func readCPUFreq() types.CPUFreq {
 	freq := types.CPUFreq{
 		Avg:     0,
 		PerCore: []float64{},
 	}
 
 	var realFreqs []float64
-	paths := []string{config.HostPath("/proc/cpuinfo"), "/proc/cpuinfo"}
-
-	for _, path := range paths {
-		if file, err := os.Open(path); err == nil {
-			scanner := bufio.NewScanner(file)
-			for scanner.Scan() {
-				line := scanner.Text()
-				if strings.Contains(line, "cpu MHz") {
-					parts := strings.Split(line, ":")
-					if len(parts) > 1 {
-						valStr := strings.TrimSpace(parts[1])
-						val, err := strconv.ParseFloat(valStr, 64)
-						if err == nil {
-							realFreqs = append(realFreqs, utils.Round(val))
-						}
+	if data, ok := readCPUInfo(); ok {
+		for len(data) > 0 {
+			var line []byte
+			line, data = nextLine(data)
+			if bytes.HasPrefix(line, []byte("cpu MHz")) {
+				if idx := bytes.IndexByte(line, ':'); idx >= 0 {
+					val, err := strconv.ParseFloat(string(bytes.TrimSpace(line[idx+1:])), 64)
+					if err == nil {
+						realFreqs = append(realFreqs, utils.Round(val))
 					}
 				}
 			}
-			file.Close()
-			break
 		}
 	}
 
@@ -189,3 +296,25 @@ func (c *CPUCollector) getCPUFreq() types.CPUFreq {
 
 	return freq
 }
+
+// cpuInfoSizeHint 是 /proc/cpuinfo 的初始读缓冲区大小（每个逻辑核约 1-1.5KiB），
+// 只用于减少扩容；ReadProcFile 会一直读到 EOF，不受内核每次 read 约一页的限制
+const cpuInfoSizeHint = 64 << 10
+
+// readCPUInfo 读取宿主机 /proc/cpuinfo，失败时回退到容器内路径
+func readCPUInfo() ([]byte, bool) {
+	for _, path := range []string{config.HostPath("/proc/cpuinfo"), "/proc/cpuinfo"} {
+		if data, err := utils.ReadProcFile(path, cpuInfoSizeHint); err == nil {
+			return data, true
+		}
+	}
+	return nil, false
+}
+
+// nextLine 从 data 中切出第一行（不含换行符），返回剩余部分
+func nextLine(data []byte) (line, rest []byte) {
+	if idx := bytes.IndexByte(data, '\n'); idx >= 0 {
+		return data[:idx], data[idx+1:]
+	}
+	return data, nil
+}
@@ -1,12 +1,16 @@
 package collectors
 
 import (
+	"bytes"
 	"context"
+	"path/filepath"
+	"strconv"
 	"strings"
 	"sync"
 	"time"
 
 	"github.com/AnalyseDeCircuit/opskernel/internal/config"
+	"github.com/AnalyseDeCircuit/opskernel/internal/monitoring"
 	"github.com/AnalyseDeCircuit/opskernel/internal/utils"
 	"github.com/AnalyseDeCircuit/opskernel/pkg/types"
 	"github.com/shirou/gopsutil/v3/disk"
@@ -19,8 +23,33 @@ type DiskCollector struct {
 	lastUpdate    time.Time
 	cacheMu       sync.Mutex
 	cacheInterval time.Duration
+
+	// 分区列表（解析 mountinfo）变化远比用量少，按更长的周期单独刷新
+	partitions          []disk.PartitionStat
+	partitionsUpdatedAt time.Time
+
+	// 上一次 /proc/diskstats 快照，用于计算读写速率
+	ioMu       sync.Mutex
+	lastIO     map[string]diskStat
+	lastIOTime time.Time
+}
+
+// diskStat 是 /proc/diskstats 一行中用到的累计计数
+type diskStat struct {
+	readCount    uint64
+	readSectors  uint64
+	readTime     uint64 // ms
+	writeCount   uint64
+	writeSectors uint64
+	writeTime    uint64 // ms
 }
 
+// diskStatsSectorSize 是 /proc/diskstats 中扇区的单位，固定为 512 字节，与设备实际扇区大小无关
+const diskStatsSectorSize = 512
+
+// diskPartitionsTTL 是分区列表的刷新周期，用量仍按 cacheInterval 刷新
+const diskPartitionsTTL = 60 * time.Second
+
 // DiskData 包含磁盘采集结果
 type DiskData struct {
 	Disks  []types.DiskInfo
@@ -53,13 +82,7 @@ func (c *DiskCollector) Collect(ctx context.Context) interface{} {
 		var newDiskInfo []types.DiskInfo
 		var newInodeInfo []types.InodeInfo
 
-		parts, _ := disk.Partitions(false)
-		for _, part := range parts {
-			// Skip loop devices and squashfs
-			if strings.Contains(part.Device, "loop") || part.Fstype == "squashfs" {
-				continue
-			}
-
+		for _, part := range c.getPartitions(now) {
 			// Check context cancellation
 			select {
 			case <-ctx.Done():
@@ -110,19 +133,132 @@ func (c *DiskCollector) Collect(ctx context.Context) interface{} {
 	c.cacheMu.Unlock()
 
 	// Disk IO (fast operation)
-	ioCounters, _ := disk.IOCounters()
-	if ioCounters != nil {
-		for name, io := range ioCounters {
-			data.IO[name] = types.DiskIOInfo{
-				ReadBytes:  utils.GetSize(io.ReadBytes),
-				WriteBytes: utils.GetSize(io.WriteBytes),
-				ReadCount:  io.ReadCount,
-				WriteCount: io.WriteCount,
-				ReadTime:   io.ReadTime,
-				WriteTime:  io.WriteTime,
+	data.IO = c.collectIO()
+
+	return data
+}
+
+// getPartitions 返回缓存的分区列表（已剔除 loop 设备与 squashfs/tmpfs 等），
+// 过滤只在刷新时做一次。调用方需持有 cacheMu
+func (c *DiskCollector) getPartitions(now time.Time) []disk.PartitionStat {
+	if c.partitions == nil || now.Sub(c.partitionsUpdatedAt) > diskPartitionsTTL {
+		if parts, err := disk.Partitions(false); err == nil {
+			filtered := make([]disk.PartitionStat, 0, len(parts))
+			for _, p := range parts {
+				if !monitoring.SkipPartition(p) {
+					filtered = append(filtered, p)
+				}
 			}
+			c.partitions = filtered
+			c.partitionsUpdatedAt = now
 		}
 	}
+	return c.partitions
+}
 
-	return data
+// collectIO 直接解析 /proc/diskstats，并与上一次快照比较得出读写速率。
+// gopsutil 的 IOCounters 还会为每个设备查询 udev 序列号和标签，这里都用不到。
+func (c *DiskCollector) collectIO() map[string]types.DiskIOInfo {
+	now := time.Now()
+	stats, err := readDiskStats()
+	if err != nil {
+		return diskIOFromGopsutil()
+	}
+
+	c.ioMu.Lock()
+	prev, prevTime := c.lastIO, c.lastIOTime
+	c.lastIO, c.lastIOTime = stats, now
+	c.ioMu.Unlock()
+
+	return diskIOFromStats(stats, prev, now.Sub(prevTime).Seconds())
+}
+
+// diskIOFromStats 将累计计数转换为对外的 DiskIOInfo；prev 为上一次快照，
+// dt 为两次快照间隔（秒）。首次采样（prev 中没有该设备）时不计算速率。
+func diskIOFromStats(stats, prev map[string]diskStat, dt float64) map[string]types.DiskIOInfo {
+	out := make(map[string]types.DiskIOInfo, len(stats))
+	for name, st := range stats {
+		info := types.DiskIOInfo{
+			ReadBytes:  utils.GetSize(st.readSectors * diskStatsSectorSize),
+			WriteBytes: utils.GetSize(st.writeSectors * diskStatsSectorSize),
+			ReadCount:  st.readCount,
+			WriteCount: st.writeCount,
+			ReadTime:   st.readTime,
+			WriteTime:  st.writeTime,
+		}
+		// 计数回绕或设备重新出现时跳过本次速率
+		if p, ok := prev[name]; ok && dt > 0 && st.readSectors >= p.readSectors && st.writeSectors >= p.writeSectors {
+			info.ReadRate = utils.Round(float64((st.readSectors-p.readSectors)*diskStatsSectorSize) / dt)
+			info.WriteRate = utils.Round(float64((st.writeSectors-p.writeSectors)*diskStatsSectorSize) / dt)
+		}
+		out[name] = info
+	}
+	return out
+}
+
+// skipDiskStatsDevice 过滤不代表物理磁盘的设备：loop、ramdisk 与 device-mapper
+// （dm- 的 IO 已计入其底层磁盘，保留会重复统计）
+func skipDiskStatsDevice(name string) bool {
+	return strings.HasPrefix(name, "loop") || strings.HasPrefix(name, "ram") || strings.HasPrefix(name, "dm-")
+}
+
+// readDiskStats 读取 /proc/diskstats
+func readDiskStats() (map[string]diskStat, error) {
+	var stats map[string]diskStat
+	err := utils.ProcFiles.Read(filepath.Join(hostProcRoot(), "diskstats"), 8<<10, func(data []byte) error {
+		stats = parseDiskStats(data)
+		return nil
+	})
+	return stats, err
+}
+
+// parseDiskStats 解析 /proc/diskstats 内容，每行格式为
+// "major minor name reads reads_merged sectors_read ms_reading writes writes_merged sectors_written ms_writing ..."
+func parseDiskStats(data []byte) map[string]diskStat {
+	stats := make(map[string]diskStat)
+	for len(data) > 0 {
+		var line []byte
+		line, data = nextLine(data)
+		fields := bytes.Fields(line)
+		if len(fields) < 11 {
+			continue
+		}
+		name := string(fields[2])
+		if skipDiskStatsDevice(name) {
+			continue
+		}
+		var v [8]uint64
+		for i := range v {
+			v[i], _ = strconv.ParseUint(string(fields[3+i]), 10, 64)
+		}
+		stats[name] = diskStat{
+			readCount:    v[0],
+			readSectors:  v[2],
+			readTime:     v[3],
+			writeCount:   v[4],
+			writeSectors: v[6],
+			writeTime:    v[7],
+		}
+	}
+	return stats
+}
+
+// diskIOFromGopsutil 是 /proc/diskstats 不可读时的回退路径（不含速率）
+func diskIOFromGopsutil() map[string]types.DiskIOInfo {
+	out := make(map[string]types.DiskIOInfo)
+	ioCounters, _ := disk.IOCounters()
+	for name, io := range ioCounters {
+		if skipDiskStatsDevice(name) {
+			continue
+		}
+		out[name] = types.DiskIOInfo{
+			ReadBytes:  utils.GetSize(io.ReadBytes),
+			WriteBytes: utils.GetSize(io.WriteBytes),
+			ReadCount:  io.ReadCount,
+			WriteCount: io.WriteCount,
+			ReadTime:   io.ReadTime,
+			WriteTime:  io.WriteTime,
+		}
+	}
+	return out
 }
@@ -0,0 +1,81 @@
+package collectors
+
+import (
+	"testing"
+
+	"github.com/AnalyseDeCircuit/opskernel/internal/utils"
+)
+
+// diskStatsSample 截取自 /proc/diskstats（内核 5.5+ 格式，共 20 列）
+const diskStatsSample = `   7       0 loop0 52 0 2104 12 0 0 0 0 0 20 12 0 0 0 0 0 0
+   1       0 ram0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0
+   8       0 sda 15263 4710 1185362 9523 27346 29854 2158648 43211 0 41244 52734 0 0 0 0 1931 0
+   8       1 sda1 15100 4710 1180000 9500 27346 29854 2158648 43211 0 41200 52711 0 0 0 0 0 0
+ 253       0 dm-0 19000 0 1170000 12000 57000 0 2158648 98000 0 41000 110000 0 0 0 0 0 0
+ 259       0 nvme0n1 100 0 8 5 200 0 16 7 0 12 12
+ 259       1 short 1 2 3
+`
+
+func TestParseDiskStats(t *testing.T) {
+	stats := parseDiskStats([]byte(diskStatsSample))
+
+	tests := []struct {
+		name     string
+		device   string
+		found    bool
+		expected diskStat
+	}{
+		{"物理磁盘", "sda", true, diskStat{readCount: 15263, readSectors: 1185362, readTime: 9523, writeCount: 27346, writeSectors: 2158648, writeTime: 43211}},
+		{"分区", "sda1", true, diskStat{readCount: 15100, readSectors: 1180000, readTime: 9500, writeCount: 27346, writeSectors: 2158648, writeTime: 43211}},
+		{"旧内核 11 列格式", "nvme0n1", true, diskStat{readCount: 100, readSectors: 8, readTime: 5, writeCount: 200, writeSectors: 16, writeTime: 7}},
+		{"跳过 loop", "loop0", false, diskStat{}},
+		{"跳过 ram", "ram0", false, diskStat{}},
+		{"跳过 dm-", "dm-0", false, diskStat{}},
+		{"跳过列数不足的行", "short", false, diskStat{}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			result, ok := stats[tt.device]
+			if ok != tt.found || result != tt.expected {
+				t.Errorf("parseDiskStats()[%s] = %+v, %v, expected %+v, %v", tt.device, result, ok, tt.expected, tt.found)
+			}
+		})
+	}
+}
+
+func TestDiskIOFromStats(t *testing.T) {
+	cur := diskStat{readCount: 10, readSectors: 3000, writeCount: 20, writeSectors: 5000}
+
+	tests := []struct {
+		name          string
+		prev          map[string]diskStat
+		dt            float64
+		expectedRead  float64
+		expectedWrite float64
+	}{
+		{"首次采样无速率", nil, 2, 0, 0},
+		{"扇区按 512 字节换算", map[string]diskStat{"sda": {readSectors: 1000, writeSectors: 1000}}, 2, 2000 * 512 / 2, 4000 * 512 / 2},
+		{"计数回绕时跳过速率", map[string]diskStat{"sda": {readSectors: 4000, writeSectors: 1000}}, 2, 0, 0},
+		{"间隔为 0 时跳过速率", map[string]diskStat{"sda": {readSectors: 1000, writeSectors: 1000}}, 0, 0, 0},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			out := diskIOFromStats(map[string]diskStat{"sda": cur}, tt.prev, tt.dt)
+			info, ok := out["sda"]
+			if !ok {
+				t.Fatalf("diskIOFromStats() missing sda")
+			}
+			if info.ReadRate != tt.expectedRead || info.WriteRate != tt.expectedWrite {
+				t.Errorf("diskIOFromStats() rate = %v/%v, expected %v/%v", info.ReadRate, info.WriteRate, tt.expectedRead, tt.expectedWrite)
+			}
+			if info.ReadBytes != utils.GetSize(3000*512) || info.WriteBytes != utils.GetSize(5000*512) {
+				t.Errorf("diskIOFromStats() bytes = %s/%s, expected sectors×512", info.ReadBytes, info.WriteBytes)
+			}
+			if info.ReadCount != 10 || info.WriteCount != 20 {
+				t.Errorf("diskIOFromStats() counts = %d/%d, expected 10/20", info.ReadCount, info.WriteCount)
+			}
+		})
+	}
+}
@@ -6,7 +6,6 @@ import (
 	"github.com/AnalyseDeCircuit/opskernel/internal/network"
 	"github.com/AnalyseDeCircuit/opskernel/internal/utils"
 	"github.com/AnalyseDeCircuit/opskernel/pkg/types"
-	gopsutilnet "github.com/shirou/gopsutil/v3/net"
 )
 
 // NetworkCollector 采集网络基础指标
@@ -32,12 +31,12 @@ func (c *NetworkCollector) Name() string {
 func (c *NetworkCollector) Collect(ctx context.Context) interface{} {
 	data := NetworkData{}
 
-	netIO, _ := gopsutilnet.IOCounters(false)
-	if len(netIO) > 0 {
-		data.BytesSent = utils.GetSize(netIO[0].BytesSent)
-		data.BytesRecv = utils.GetSize(netIO[0].BytesRecv)
-		data.RawSent = netIO[0].BytesSent
-		data.RawRecv = netIO[0].BytesRecv
+	if devs, err := network.ReadNetDev(); err == nil {
+		total := network.SumNetDev(devs)
+		data.BytesSent = utils.GetSize(total.BytesSent)
+		data.BytesRecv = utils.GetSize(total.BytesRecv)
+		data.RawSent = total.BytesSent
+		data.RawRecv = total.BytesRecv
 	}
 
 	return data
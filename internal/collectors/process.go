@@ -1,18 +1,27 @@
 package collectors
 
 import (
+	"bytes"
 	"context"
 	"fmt"
 	"log"
+	"os"
+	"path/filepath"
 	"sort"
+	"strconv"
 	"sync"
 	"time"
 
+	"github.com/AnalyseDeCircuit/opskernel/internal/config"
 	"github.com/AnalyseDeCircuit/opskernel/internal/utils"
 	"github.com/AnalyseDeCircuit/opskernel/pkg/types"
+	"github.com/shirou/gopsutil/v3/mem"
 	"github.com/shirou/gopsutil/v3/process"
 )
 
+// procClockTicks 是 /proc/<pid>/stat 中时间字段的单位（USER_HZ），Linux 上几乎总是 100
+const procClockTicks = 100
+
 // ProcessCollector 采集进程信息
 type ProcessCollector struct {
 	cache        map[int32]*processCacheEntry
@@ -26,6 +35,7 @@ type processCacheEntry struct {
 	username   string
 	cmdline    string
 	createTime int64
+	startTime  uint64 // /proc/<pid>/stat 第 22 字段，用于识别 PID 复用
 	ppid       int32
 }
 
@@ -68,24 +78,45 @@ func (c *ProcessCollector) Collect(ctx context.Context) interface{} {
 		return []types.ProcessInfo{}
 	}
 
+	// 系统总内存每轮只读一次，而不是每个进程读一次 /proc/meminfo
+	var memTotal uint64
+	if vm, err := mem.VirtualMemoryWithContext(ctx); err == nil {
+		memTotal = vm.Total
+	}
+	pageSize := uint64(os.Getpagesize())
+	procRoot := hostProcRoot()
+
 	c.cacheMu.Lock()
 	defer c.cacheMu.Unlock()
 
 	seenPids := make(map[int32]bool)
-	var result []types.ProcessInfo
+	rows := make([]types.ProcessInfo, 0, len(pids))
+	// 排序只需要内存占用这一列：按紧凑的 (mem, idx) 键排序，
+	// 而不是让 sort.Slice 在每次交换时搬动整个 ProcessInfo 结构体
+	keys := make([]processSortKey, 0, len(pids))
 
 	for _, pid := range pids {
 		// Check context cancellation periodically
 		select {
 		case <-ctx.Done():
-			return result
+			return rows
 		default:
 		}
 
+		// Fetch dynamic info: one /proc/<pid>/stat read replaces the separate
+		// CPUPercent/MemoryPercent/NumThreads calls, each of which re-read
+		// stat/statm/status (and /proc/meminfo) for every process.
+		st, ok := readProcStat(procRoot, pid)
+		if !ok {
+			// 进程已退出，丢弃其缓存句柄
+			delete(c.cache, pid)
+			continue
+		}
 		seenPids[pid] = true
 
+		// 缓存以 (pid, starttime) 为键：PID 被复用时 starttime 必然不同，需重建条目
 		entry, exists := c.cache[pid]
-		if !exists {
+		if !exists || entry.startTime != st.startTime {
 			proc, err := process.NewProcess(pid)
 			if err != nil {
 				continue
@@ -103,7 +134,6 @@ func (c *ProcessCollector) Collect(ctx context.Context) interface{} {
 			}
 			cmdline, _ := proc.Cmdline()
 			createTime, _ := proc.CreateTime()
-			ppid, _ := proc.Ppid()
 
 			entry = &processCacheEntry{
 				proc:       proc,
@@ -111,26 +141,28 @@ func (c *ProcessCollector) Collect(ctx context.Context) interface{} {
 				username:   username,
 				cmdline:    cmdline,
 				createTime: createTime,
-				ppid:       ppid,
+				startTime:  st.startTime,
 			}
 			c.cache[pid] = entry
 		}
 
-		// Fetch dynamic info
-		cpuPercent, _ := entry.proc.CPUPercent()
-		memPercent, _ := entry.proc.MemoryPercent()
-		numThreads, _ := entry.proc.NumThreads()
+		entry.ppid = st.ppid
+
+		cpuPercent := 0.0
+		if elapsed := time.Since(time.UnixMilli(entry.createTime)).Seconds(); elapsed > 0 {
+			cpuPercent = 100 * float64(st.cpuTicks) / procClockTicks / elapsed
+		}
+		memPercent := 0.0
+		if memTotal > 0 {
+			memPercent = 100 * float64(st.rssPages*pageSize) / float64(memTotal)
+		}
 
-		// IO data is fetched on-demand via /api/process/io to reduce CPU overhead
-		// (IOCounters() requires reading /proc/[pid]/io for each process)
+		// IO data and cwd are fetched on-demand via /api/process/io to reduce CPU overhead
+		// (IOCounters() and Cwd() require reading /proc/[pid]/io and readlink(/proc/[pid]/cwd)
+		// for each process, but only the process opened in the detail view needs them)
 		ioRead := "-"
 		ioWrite := "-"
 
-		cwd, _ := entry.proc.Cwd()
-		if cwd == "" {
-			cwd = "-"
-		}
-
 		uptimeSec := time.Now().Unix() - (entry.createTime / 1000)
 		uptimeStr := "-"
 		if uptimeSec < 60 {
@@ -143,17 +175,17 @@ func (c *ProcessCollector) Collect(ctx context.Context) interface{} {
 			uptimeStr = fmt.Sprintf("%dd", uptimeSec/86400)
 		}
 
-		result = append(result, types.ProcessInfo{
+		keys = append(keys, processSortKey{mem: memPercent, idx: int32(len(rows))})
+		rows = append(rows, types.ProcessInfo{
 			PID:           pid,
 			Name:          entry.name,
 			Username:      entry.username,
-			NumThreads:    numThreads,
-			MemoryPercent: utils.Round(float64(memPercent)),
+			NumThreads:    st.numThreads,
+			MemoryPercent: utils.Round(memPercent),
 			CPUPercent:    utils.Round(cpuPercent),
 			PPID:          entry.ppid,
 			Uptime:        uptimeStr,
 			Cmdline:       entry.cmdline,
-			Cwd:           cwd,
 			IORead:        ioRead,
 			IOWrite:       ioWrite,
 		})
@@ -169,10 +201,71 @@ func (c *ProcessCollector) Collect(ctx context.Context) interface{} {
 	// Check if cache needs cleanup due to size
 	c.CleanupCache(seenPids)
 
-	// Sort by memory percent desc
-	sort.Slice(result, func(i, j int) bool {
-		return result[i].MemoryPercent > result[j].MemoryPercent
+	// Sort by memory percent desc, then gather rows in key order
+	sort.Slice(keys, func(i, j int) bool {
+		if keys[i].mem != keys[j].mem {
+			return keys[i].mem > keys[j].mem
+		}
+		return keys[i].idx < keys[j].idx
 	})
+	result := make([]types.ProcessInfo, len(keys))
+	for i, k := range keys {
+		result[i] = rows[k.idx]
+	}
 
 	return result
 }
+
+// processSortKey 是排序用的紧凑键，idx 指向 rows 中的对应行
+type processSortKey struct {
+	mem float64
+	idx int32
+}
+
+// procStat 是从 /proc/<pid>/stat 一次读取得到的动态字段
+type procStat struct {
+	ppid       int32
+	numThreads int32
+	cpuTicks   uint64 // utime + stime + delayacct_blkio_ticks
+	startTime  uint64 // 进程启动时间（自开机起的 clock ticks）
+	rssPages   uint64
+}
+
+func hostProcRoot() string {
+	if config.GlobalConfig != nil && config.GlobalConfig.HostProc != "" {
+		return config.GlobalConfig.HostProc
+	}
+	return "/proc"
+}
+
+// readProcStat 解析 /proc/<pid>/stat。comm 字段可能包含空格和括号，
+// 因此从最后一个 ')' 之后开始按空格切分。
+func readProcStat(procRoot string, pid int32) (procStat, bool) {
+	var st procStat
+	data, err := os.ReadFile(filepath.Join(procRoot, strconv.Itoa(int(pid)), "stat"))
+	if err != nil {
+		return st, false
+	}
+	idx := bytes.LastIndexByte(data, ')')
+	if idx < 0 {
+		return st, false
+	}
+	// fields[0] 对应 man proc 中的第 3 个字段 (state)
+	fields := bytes.Fields(data[idx+1:])
+	if len(fields) < 22 {
+		return st, false
+	}
+	field := func(n int) uint64 {
+		v, _ := strconv.ParseUint(string(fields[n-3]), 10, 64)
+		return v
+	}
+	st.ppid = int32(field(4))
+	st.cpuTicks = field(14) + field(15)
+	if len(fields) >= 40 {
+		st.cpuTicks += field(42)
+	}
+	st.numThreads = int32(field(20))
+	st.startTime = field(22)
+	st.rssPages = field(24)
+	return st, true
+}
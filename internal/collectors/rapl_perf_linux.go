@@ -0,0 +1,179 @@
+package collectors
+
+import (
+	"encoding/binary"
+	"os"
+	"path/filepath"
+	"strconv"
+	"strings"
+	"unsafe"
+
+	"github.com/AnalyseDeCircuit/opskernel/internal/config"
+	"golang.org/x/sys/unix"
+)
+
+// raplPerfEvents 将 perf "power" PMU 的事件名映射为与 powercap 一致的域名
+var raplPerfEvents = []struct {
+	event  string
+	domain string
+}{
+	{"energy-pkg", "package"},
+	{"energy-cores", "core"},
+	{"energy-gpu", "uncore"},
+	{"energy-ram", "dram"},
+	{"energy-psys", "psys"},
+}
+
+// raplPerfCounter 是一个已打开的 RAPL perf 事件（每个 socket 一个 fd）
+type raplPerfCounter struct {
+	key    string // 唯一标识，用于保存上一次读数
+	domain string // 对外展示的域名，如 package-0 / dram
+	fd     int
+	scale  float64 // 每个计数对应的焦耳数
+}
+
+// raplPerfReader 通过 perf_event_open 读取 RAPL 能量计数器。
+// 相比每次打开 powercap 的 energy_uj，读取已打开的 fd 开销更低，
+// 且内核会将 32 位硬件寄存器累加为 64 位计数，无需处理回绕。
+type raplPerfReader struct {
+	counters []raplPerfCounter
+	buf      [8]byte
+}
+
+// raplPerfPMUDir 返回 power PMU 的 sysfs 目录，不存在时返回空字符串
+func raplPerfPMUDir() string {
+	for _, base := range []string{config.HostPath("/sys/bus/event_source/devices/power"), "/sys/bus/event_source/devices/power"} {
+		if _, err := os.Stat(filepath.Join(base, "type")); err == nil {
+			return base
+		}
+	}
+	return ""
+}
+
+// newRaplPerfReader 为每个可用的 RAPL 事件打开 perf fd。
+// 没有 power PMU 或权限不足（EACCES/EPERM）时返回 nil，调用方回退到 powercap。
+func newRaplPerfReader() *raplPerfReader {
+	pmuDir := raplPerfPMUDir()
+	if pmuDir == "" {
+		return nil
+	}
+	pmuType, err := readSysfsUint(filepath.Join(pmuDir, "type"))
+	if err != nil {
+		return nil
+	}
+	cpus := parseCPUMask(filepath.Join(pmuDir, "cpumask"))
+	if len(cpus) == 0 {
+		cpus = []int{0}
+	}
+
+	r := &raplPerfReader{}
+	for _, ev := range raplPerfEvents {
+		cfg, ok := readPerfEventConfig(filepath.Join(pmuDir, "events", ev.event))
+		if !ok {
+			continue
+		}
+		scale := 1.0
+		if content, err := os.ReadFile(filepath.Join(pmuDir, "events", ev.event+".scale")); err == nil {
+			if v, err := strconv.ParseFloat(strings.TrimSpace(string(content)), 64); err == nil && v > 0 {
+				scale = v
+			}
+		}
+
+		for i, cpu := range cpus {
+			attr := unix.PerfEventAttr{
+				Type:   uint32(pmuType),
+				Size:   uint32(unsafe.Sizeof(unix.PerfEventAttr{})),
+				Config: cfg,
+			}
+			fd, err := unix.PerfEventOpen(&attr, -1, cpu, -1, unix.PERF_FLAG_FD_CLOEXEC)
+			if err != nil {
+				// 权限不足时所有事件都会失败，直接放弃 perf 路径
+				if err == unix.EACCES || err == unix.EPERM {
+					r.close()
+					return nil
+				}
+				continue
+			}
+			domain := ev.domain
+			if ev.domain == "package" {
+				domain = "package-" + strconv.Itoa(i)
+			}
+			r.counters = append(r.counters, raplPerfCounter{
+				key:    ev.event + ":" + strconv.Itoa(cpu),
+				domain: domain,
+				fd:     fd,
+				scale:  scale,
+			})
+		}
+	}
+
+	if len(r.counters) == 0 {
+		return nil
+	}
+	return r
+}
+
+// read 读取计数器的 64 位累计值并换算为微焦，与 powercap 的 energy_uj 单位一致
+func (r *raplPerfReader) read(c *raplPerfCounter) (uint64, bool) {
+	n, err := unix.Read(c.fd, r.buf[:])
+	if err != nil || n != len(r.buf) {
+		return 0, false
+	}
+	return uint64(float64(binary.NativeEndian.Uint64(r.buf[:])) * c.scale * 1e6), true
+}
+
+func (r *raplPerfReader) close() {
+	for _, c := range r.counters {
+		unix.Close(c.fd)
+	}
+	r.counters = nil
+}
+
+func readSysfsUint(path string) (uint64, error) {
+	content, err := os.ReadFile(path)
+	if err != nil {
+		return 0, err
+	}
+	return strconv.ParseUint(strings.TrimSpace(string(content)), 10, 64)
+}
+
+// readPerfEventConfig 解析形如 "event=0x02" 的事件描述
+func readPerfEventConfig(path string) (uint64, bool) {
+	content, err := os.ReadFile(path)
+	if err != nil {
+		return 0, false
+	}
+	for _, term := range strings.Split(strings.TrimSpace(string(content)), ",") {
+		if v, ok := strings.CutPrefix(term, "event="); ok {
+			cfg, err := strconv.ParseUint(v, 0, 64)
+			return cfg, err == nil
+		}
+	}
+	return 0, false
+}
+
+// parseCPUMask 解析 PMU 的 cpumask（如 "0" 或 "0,28" 或 "0-1"），每个 socket 一个 CPU
+func parseCPUMask(path string) []int {
+	content, err := os.ReadFile(path)
+	if err != nil {
+		return nil
+	}
+	var cpus []int
+	for _, part := range strings.Split(strings.TrimSpace(string(content)), ",") {
+		lo, hi, isRange := strings.Cut(part, "-")
+		start, err := strconv.Atoi(lo)
+		if err != nil {
+			continue
+		}
+		end := start
+		if isRange {
+			if end, err = strconv.Atoi(hi); err != nil {
+				continue
+			}
+		}
+		for cpu := start; cpu <= end; cpu++ {
+			cpus = append(cpus, cpu)
+		}
+	}
+	return cpus
+}
@@ -0,0 +1,19 @@
+//go:build !linux
+
+package collectors
+
+// raplPerfCounter 在非 Linux 平台上没有 perf_event_open，仅用于保持接口一致
+type raplPerfCounter struct {
+	key    string
+	domain string
+}
+
+type raplPerfReader struct {
+	counters []raplPerfCounter
+}
+
+func newRaplPerfReader() *raplPerfReader { return nil }
+
+func (r *raplPerfReader) read(c *raplPerfCounter) (uint64, bool) { return 0, false }
+
+func (r *raplPerfReader) close() {}
@@ -2,11 +2,12 @@ package collectors
 
 import (
 	"context"
+	"io"
 	"os"
 	"path/filepath"
-	"strconv"
 	"strings"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/AnalyseDeCircuit/opskernel/internal/config"
@@ -14,8 +15,27 @@ import (
 	"github.com/shirou/gopsutil/v3/host"
 )
 
+// hwmonRescan 是 hwmon 传感器列表的重新扫描周期。标签、阈值在开机后基本不变，
+// 只有热插拔或驱动重载才会改变传感器集合。
+const hwmonRescan = 60 * time.Second
+
+// hwmonSensor 是一个已打开的 hwmon 温度传感器。键名与阈值在扫描时读取一次，
+// 之后每次采集只对 temp*_input 做一次 pread。
+type hwmonSensor struct {
+	key      string   // 与 gopsutil SensorKey 一致，如 coretemp_core_0
+	input    *os.File // temp*_input
+	high     float64
+	critical float64
+}
+
 // SensorsCollector 采集传感器温度
-type SensorsCollector struct{}
+type SensorsCollector struct {
+	mu        sync.Mutex
+	sensors   []hwmonSensor
+	scannedAt time.Time
+	// 没有 hwmon 温度文件时（如部分树莓派发行版只有 thermal_zone）回退到 gopsutil
+	useGopsutil bool
+}
 
 // NewSensorsCollector 创建传感器采集器
 func NewSensorsCollector() *SensorsCollector {
@@ -27,25 +47,168 @@ func (c *SensorsCollector) Name() string {
 }
 
 func (c *SensorsCollector) Collect(ctx context.Context) interface{} {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	now := time.Now()
+	if c.scannedAt.IsZero() || now.Sub(c.scannedAt) > hwmonRescan {
+		c.scanHwmon(now)
+	}
+
 	sensors := make(map[string][]interface{})
-	if temps, err := host.SensorsTemperatures(); err == nil {
-		for _, t := range temps {
-			sensors[t.SensorKey] = append(sensors[t.SensorKey], map[string]interface{}{
-				"label":    t.SensorKey,
-				"current":  t.Temperature,
-				"high":     t.High,
-				"critical": t.Critical,
-			})
+	if c.useGopsutil {
+		if temps, err := host.SensorsTemperatures(); err == nil {
+			for _, t := range temps {
+				sensors[t.SensorKey] = append(sensors[t.SensorKey], sensorEntry(t.SensorKey, t.Temperature, t.High, t.Critical))
+			}
+		}
+		return sensors
+	}
+
+	for i := range c.sensors {
+		s := &c.sensors[i]
+		current, ok := readMilliCelsius(s.input)
+		if !ok {
+			// 部分驱动在传感器暂不可用时返回 ENODATA 等错误，与 gopsutil 一样跳过本次读数
+			continue
 		}
+		sensors[s.key] = append(sensors[s.key], sensorEntry(s.key, current, s.high, s.critical))
 	}
 	return sensors
 }
 
+func sensorEntry(key string, current, high, critical float64) map[string]interface{} {
+	return map[string]interface{}{
+		"label":    key,
+		"current":  current,
+		"high":     high,
+		"critical": critical,
+	}
+}
+
+// scanHwmon 重新发现 hwmon 温度传感器，读取静态的名称、标签与阈值并打开 temp*_input。
+// 查找顺序与 gopsutil 相同：hwmon*/temp*_input，其次 hwmon*/device/temp*_input。
+// 调用方需持有 mu。
+func (c *SensorsCollector) scanHwmon(now time.Time) {
+	c.closeHwmon()
+	c.scannedAt = now
+
+	base := filepath.Join(hostSysRoot(), "class", "hwmon")
+	files, _ := filepath.Glob(filepath.Join(base, "hwmon*", "temp*_input"))
+	if len(files) == 0 {
+		files, _ = filepath.Glob(filepath.Join(base, "hwmon*", "device", "temp*_input"))
+	}
+	c.useGopsutil = len(files) == 0
+
+	names := make(map[string]string) // 目录 -> name，同一芯片的多个传感器共用
+	for _, file := range files {
+		dir := filepath.Dir(file)
+		name, ok := names[dir]
+		if !ok {
+			raw, err := utils.ReadProcFile(filepath.Join(dir, "name"), 64)
+			if err != nil {
+				names[dir] = ""
+				continue
+			}
+			name = strings.TrimSpace(string(raw))
+			names[dir] = name
+		}
+		if name == "" {
+			continue
+		}
+
+		// temp1_input -> <dir>/temp1
+		basepath := filepath.Join(dir, strings.SplitN(filepath.Base(file), "_", 2)[0])
+		key := name
+		if raw, err := utils.ReadProcFile(basepath+"_label", 64); err == nil && len(raw) > 0 {
+			// "Core 0" -> "core_0"
+			key = name + "_" + strings.Join(strings.Split(strings.TrimSpace(strings.ToLower(string(raw))), " "), "_")
+		}
+
+		f, err := os.Open(file)
+		if err != nil {
+			continue
+		}
+		c.sensors = append(c.sensors, hwmonSensor{
+			key:      key,
+			input:    f,
+			high:     readOptionalMilliCelsius(basepath + "_max"),
+			critical: readOptionalMilliCelsius(basepath + "_crit"),
+		})
+	}
+}
+
+// Close 关闭已打开的传感器文件，下次采集时重新扫描
+func (c *SensorsCollector) Close() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	c.closeHwmon()
+	c.scannedAt = time.Time{}
+}
+
+// closeHwmon 关闭所有已打开的 temp*_input，调用方需持有 mu
+func (c *SensorsCollector) closeHwmon() {
+	for _, s := range c.sensors {
+		s.input.Close()
+	}
+	c.sensors = nil
+}
+
+// readMilliCelsius 读取以毫摄氏度表示的温度并换算为摄氏度
+func readMilliCelsius(f *os.File) (float64, bool) {
+	v, ok := preadInt(f)
+	return float64(v) / 1000.0, ok
+}
+
+// readOptionalMilliCelsius 读取 temp*_max/temp*_crit，文件不存在或无法解析时返回 0
+func readOptionalMilliCelsius(path string) float64 {
+	v, err := utils.ReadProcInt(path)
+	if err != nil {
+		return 0
+	}
+	return float64(v) / 1000.0
+}
+
+func hostSysRoot() string {
+	if config.GlobalConfig != nil && config.GlobalConfig.HostSys != "" {
+		return config.GlobalConfig.HostSys
+	}
+	return "/sys"
+}
+
+const (
+	// powerSampleInterval 是后台功耗采样周期。持续采样可以及时捕获计数器回绕，
+	// 也让 Collect 只需读取内存中的最新结果。
+	powerSampleInterval = 500 * time.Millisecond
+	// powerEMAAlpha 是功率指数滑动平均的平滑系数
+	powerEMAAlpha = 0.3
+)
+
 // PowerCollector 采集电源/功耗信息
 type PowerCollector struct {
 	raplReadings map[string]uint64
 	raplTime     time.Time
 	raplMu       sync.Mutex
+
+	// perf_event_open 读取器，首次采集时探测；不可用时回退到 powercap sysfs
+	raplPerf       *raplPerfReader
+	raplPerfProbed bool
+
+	// powercap 回退路径：域列表、名称与 max_energy_range_uj 只在扫描时读取，
+	// energy_uj 保持打开，每次采样只做一次 pread
+	raplPowercap          []raplPowercapDomain
+	raplPowercapScannedAt time.Time
+
+	// power_supply 探测结果：哪个电源、使用 power_now 还是 voltage_now×current_now，
+	// 探测时确定并保持文件打开，之后每次采样只读已知可用的文件
+	supplyMu        sync.Mutex
+	supply          *powerSupplySource
+	supplyScannedAt time.Time
+
+	// 后台采样结果（map[string]interface{}），sampling 为 true 时 Collect 直接返回它
+	latest   atomic.Value
+	sampling atomic.Bool
+	emaWatts map[string]float64 // 仅由采样 goroutine 访问
 }
 
 // NewPowerCollector 创建电源采集器
@@ -59,128 +222,382 @@ func (c *PowerCollector) Name() string {
 	return "power"
 }
 
+// Collect 返回后台采样的最新结果；采样器未运行时同步采样一次
 func (c *PowerCollector) Collect(ctx context.Context) interface{} {
-	powerStatus := make(map[string]interface{})
-
-	// Try to read battery/adapter power consumption
-	basePaths := []string{config.HostPath("/sys/class/power_supply"), "/sys/class/power_supply"}
-	foundConsumption := false
-	for _, basePath := range basePaths {
-		if _, err := os.Stat(basePath); err != nil {
-			continue
+	if c.sampling.Load() {
+		if v := c.latest.Load(); v != nil {
+			return v
 		}
+	}
+	return c.sample()
+}
 
-		entries, _ := os.ReadDir(basePath)
-		for _, e := range entries {
-			supplyPath := filepath.Join(basePath, e.Name())
+// RunSampler 以 powerSampleInterval 为周期在后台采样 power_supply 与 RAPL，
+// 并保存最新结果及其指数滑动平均。阻塞直到 ctx 取消；退出时关闭 perf fd 并清空基线，
+// 以便重新启动后重新探测。
+func (c *PowerCollector) RunSampler(ctx context.Context) {
+	c.sampling.Store(true)
+	defer func() {
+		c.sampling.Store(false)
+		c.resetRAPL()
+	}()
 
-			// Prefer power_now (microwatts)
-			if content, err := os.ReadFile(filepath.Join(supplyPath, "power_now")); err == nil {
-				if pNow, err := strconv.ParseFloat(strings.TrimSpace(string(content)), 64); err == nil {
-					powerStatus["consumption_watts"] = utils.Round(pNow / 1000000.0)
-					foundConsumption = true
-					break
-				}
-			}
+	ticker := time.NewTicker(powerSampleInterval)
+	defer ticker.Stop()
 
-			// Fallback: voltage_now * current_now
-			vBytes, err1 := os.ReadFile(filepath.Join(supplyPath, "voltage_now"))
-			cBytes, err2 := os.ReadFile(filepath.Join(supplyPath, "current_now"))
-			if err1 == nil && err2 == nil {
-				vNow, _ := strconv.ParseFloat(strings.TrimSpace(string(vBytes)), 64)
-				cNow, _ := strconv.ParseFloat(strings.TrimSpace(string(cBytes)), 64)
-				powerStatus["consumption_watts"] = utils.Round((vNow * cNow) / 1e12)
-				foundConsumption = true
-				break
-			}
+	for {
+		c.latest.Store(c.smooth(c.sample()))
+		select {
+		case <-ctx.Done():
+			return
+		case <-ticker.C:
 		}
-		if foundConsumption {
-			break
+	}
+}
+
+// smooth 在原始读数之外附加指数滑动平均：consumption_watts 与 rapl 保持本次采样的原始值，
+// 平均值分别以 consumption_watts_avg 与 rapl_avg 给出，避免覆盖原始读数。
+// 仅由采样 goroutine 调用。
+func (c *PowerCollector) smooth(powerStatus map[string]interface{}) map[string]interface{} {
+	if c.emaWatts == nil {
+		c.emaWatts = make(map[string]float64)
+	}
+	ema := func(key string, v float64) float64 {
+		prev, ok := c.emaWatts[key]
+		if ok {
+			v = powerEMAAlpha*v + (1-powerEMAAlpha)*prev
 		}
+		c.emaWatts[key] = v
+		return utils.Round(v)
+	}
+
+	if w, ok := powerStatus["consumption_watts"].(float64); ok {
+		powerStatus["consumption_watts_avg"] = ema("consumption_watts", w)
+	}
+	if domains, ok := powerStatus["rapl"].(map[string]float64); ok {
+		avg := make(map[string]float64, len(domains))
+		for name, w := range domains {
+			avg[name] = ema("rapl:"+name, w)
+		}
+		powerStatus["rapl_avg"] = avg
+	}
+	return powerStatus
+}
+
+// resetRAPL 关闭 perf fd 并清空能量计数基线
+func (c *PowerCollector) resetRAPL() {
+	c.raplMu.Lock()
+	defer c.raplMu.Unlock()
+	if c.raplPerf != nil {
+		c.raplPerf.close()
+		c.raplPerf = nil
+	}
+	c.raplPerfProbed = false
+	c.closeRAPLPowercap()
+	c.raplReadings = make(map[string]uint64)
+	c.raplTime = time.Time{}
+	c.emaWatts = nil
+
+	c.supplyMu.Lock()
+	c.closePowerSupply()
+	c.supplyMu.Unlock()
+}
+
+// sample 读取一次 power_supply 与 RAPL 功耗
+func (c *PowerCollector) sample() map[string]interface{} {
+	powerStatus := make(map[string]interface{})
+
+	// Battery/adapter power consumption
+	if watts, ok := c.readPowerSupply(); ok {
+		powerStatus["consumption_watts"] = utils.Round(watts)
 	}
 
 	// RAPL (Intel Power)
 	c.raplMu.Lock()
 	defer c.raplMu.Unlock()
 
-	raplBasePaths := []string{config.HostPath("/sys/class/powercap"), "/sys/class/powercap"}
 	now := time.Now()
 	raplDomains := make(map[string]float64)
+	var totalWatts float64
+	var hasNewReading bool
+
+	if !c.raplPerfProbed {
+		c.raplPerfProbed = true
+		c.raplPerf = newRaplPerfReader()
+	}
+	if c.raplPerf != nil {
+		totalWatts, hasNewReading = c.collectRAPLPerf(now, raplDomains)
+	} else {
+		totalWatts, hasNewReading = c.collectRAPLPowercap(now, raplDomains)
+	}
+
+	if hasNewReading {
+		c.raplTime = now
+	}
+	if totalWatts > 0 {
+		powerStatus["consumption_watts"] = utils.Round(totalWatts)
+	}
+	if len(raplDomains) > 0 {
+		powerStatus["rapl"] = raplDomains
+	}
+
+	return powerStatus
+}
+
+// collectRAPLPerf 通过已打开的 perf fd 读取 RAPL 计数器。
+// 内核已将计数累加为 64 位，无需处理回绕。
+func (c *PowerCollector) collectRAPLPerf(now time.Time, raplDomains map[string]float64) (float64, bool) {
 	totalWatts := 0.0
 	hasNewReading := false
+	dt := now.Sub(c.raplTime).Seconds()
+
+	for i := range c.raplPerf.counters {
+		counter := &c.raplPerf.counters[i]
+		energyUj, ok := c.raplPerf.read(counter)
+		if !ok {
+			continue
+		}
+
+		if lastEnergy, ok := c.raplReadings[counter.key]; ok && !c.raplTime.IsZero() && dt > 0 && energyUj >= lastEnergy {
+			watts := (float64(energyUj-lastEnergy) / 1000000.0) / dt
+			// 多 socket 时 dram/core 等同名域按 socket 求和
+			raplDomains[counter.domain] = utils.Round(raplDomains[counter.domain] + watts)
+			if strings.HasPrefix(counter.domain, "package") {
+				totalWatts += watts
+			}
+		}
+
+		c.raplReadings[counter.key] = energyUj
+		hasNewReading = true
+	}
+
+	return totalWatts, hasNewReading
+}
+
+// powerSupplyRescan 是 power_supply 的重新探测周期，用于发现新接入的电源
+const powerSupplyRescan = 60 * time.Second
+
+// powerSupplySource 是探测到的可用电源读数来源，power 与 voltage/current 二选一
+type powerSupplySource struct {
+	power   *os.File // power_now（微瓦）
+	voltage *os.File // voltage_now（微伏）
+	current *os.File // current_now（微安）
+}
+
+func (s *powerSupplySource) close() {
+	for _, f := range []*os.File{s.power, s.voltage, s.current} {
+		if f != nil {
+			f.Close()
+		}
+	}
+}
+
+// readWatts 读取当前功率（瓦）
+func (s *powerSupplySource) readWatts() (float64, bool) {
+	if s.power != nil {
+		p, ok := preadInt(s.power)
+		return float64(p) / 1e6, ok
+	}
+	v, ok1 := preadInt(s.voltage)
+	i, ok2 := preadInt(s.current)
+	return float64(v) * float64(i) / 1e12, ok1 && ok2
+}
+
+// readPowerSupply 返回电池/适配器的功率。读取失败时关闭文件并在下次采样时重新探测。
+func (c *PowerCollector) readPowerSupply() (float64, bool) {
+	c.supplyMu.Lock()
+	defer c.supplyMu.Unlock()
+
+	now := time.Now()
+	if c.supplyScannedAt.IsZero() || now.Sub(c.supplyScannedAt) > powerSupplyRescan {
+		c.scanPowerSupply(now)
+	}
+	if c.supply == nil {
+		return 0, false
+	}
+	watts, ok := c.supply.readWatts()
+	if !ok {
+		c.closePowerSupply()
+		c.supplyScannedAt = time.Time{}
+	}
+	return watts, ok
+}
+
+// scanPowerSupply 按目录顺序找到第一个可读的电源：优先 power_now，
+// 其次 voltage_now × current_now。调用方需持有 supplyMu。
+func (c *PowerCollector) scanPowerSupply(now time.Time) {
+	c.closePowerSupply()
+	c.supplyScannedAt = now
+
+	for _, basePath := range []string{config.HostPath("/sys/class/power_supply"), "/sys/class/power_supply"} {
+		entries, err := os.ReadDir(basePath)
+		if err != nil {
+			continue
+		}
+		for _, e := range entries {
+			supplyPath := filepath.Join(basePath, e.Name())
+			if f, ok := openReadable(filepath.Join(supplyPath, "power_now")); ok {
+				c.supply = &powerSupplySource{power: f}
+				return
+			}
+			v, okV := openReadable(filepath.Join(supplyPath, "voltage_now"))
+			i, okI := openReadable(filepath.Join(supplyPath, "current_now"))
+			if okV && okI {
+				c.supply = &powerSupplySource{voltage: v, current: i}
+				return
+			}
+			if okV {
+				v.Close()
+			}
+			if okI {
+				i.Close()
+			}
+		}
+	}
+}
+
+// closePowerSupply 关闭已打开的电源文件，调用方需持有 supplyMu
+func (c *PowerCollector) closePowerSupply() {
+	if c.supply != nil {
+		c.supply.close()
+		c.supply = nil
+	}
+}
+
+// openReadable 打开 sysfs 整数文件并确认当前能读出数值（部分电源在未接入时读取会返回错误）
+func openReadable(path string) (*os.File, bool) {
+	f, err := os.Open(path)
+	if err != nil {
+		return nil, false
+	}
+	if _, ok := preadInt(f); !ok {
+		f.Close()
+		return nil, false
+	}
+	return f, true
+}
+
+// preadInt 用 pread 从偏移 0 重新读取只包含一个整数的 sysfs 文件，sysfs 每次读取都会返回最新值
+func preadInt(f *os.File) (int64, bool) {
+	var buf [32]byte
+	n, err := f.ReadAt(buf[:], 0)
+	if n == 0 || (err != nil && err != io.EOF) {
+		return 0, false
+	}
+	v, err := utils.ParseIntBytes(buf[:n])
+	return v, err == nil
+}
+
+// raplPowercapRescan 是 powercap 域列表的重新扫描周期，用于发现热插拔或驱动重载
+const raplPowercapRescan = 60 * time.Second
+
+// raplPowercapDomain 是一个已打开的 powercap RAPL 域
+type raplPowercapDomain struct {
+	path     string   // 域目录，同时作为 raplReadings 的键
+	name     string   // 如 package-0、dram
+	energy   *os.File // energy_uj
+	maxRange uint64   // max_energy_range_uj，计数回绕时使用；0 表示未知
+}
+
+// scanRAPLPowercap 重新发现 powercap 域并打开各自的 energy_uj。
+// 与 perf PMU 一样只使用第一个存在 RAPL 域的目录，避免宿主机路径与容器内路径
+// 指向同一组计数器时被重复累加。调用方需持有 raplMu。
+func (c *PowerCollector) scanRAPLPowercap(now time.Time) {
+	c.closeRAPLPowercap()
+	c.raplPowercapScannedAt = now
 
-	for _, basePath := range raplBasePaths {
+	for _, basePath := range []string{config.HostPath("/sys/class/powercap"), "/sys/class/powercap"} {
 		matches, err := filepath.Glob(filepath.Join(basePath, "intel-rapl:*"))
 		if err != nil || len(matches) == 0 {
 			continue
 		}
 
 		for _, domainPath := range matches {
-			nameFile := filepath.Join(domainPath, "name")
-			nameBytes, err := os.ReadFile(nameFile)
+			nameBytes, err := utils.ReadProcFile(filepath.Join(domainPath, "name"), 64)
 			if err != nil {
 				continue
 			}
-			name := strings.TrimSpace(string(nameBytes))
-
-			energyFile := filepath.Join(domainPath, "energy_uj")
-			maxEnergyFile := filepath.Join(domainPath, "max_energy_range_uj")
-
-			energyBytes, err := os.ReadFile(energyFile)
+			f, err := os.Open(filepath.Join(domainPath, "energy_uj"))
 			if err != nil {
 				continue
 			}
-			energyUj, parseErr := strconv.ParseUint(strings.TrimSpace(string(energyBytes)), 10, 64)
-			if parseErr != nil {
-				continue
+			d := raplPowercapDomain{
+				path:   domainPath,
+				name:   strings.TrimSpace(string(nameBytes)),
+				energy: f,
 			}
+			if v, err := utils.ReadProcInt(filepath.Join(domainPath, "max_energy_range_uj")); err == nil && v > 0 {
+				d.maxRange = uint64(v)
+			}
+			c.raplPowercap = append(c.raplPowercap, d)
+		}
+		return
+	}
+}
 
-			if lastEnergy, ok := c.raplReadings[domainPath]; ok && !c.raplTime.IsZero() {
-				dt := now.Sub(c.raplTime).Seconds()
-				if dt > 0 {
-					var de uint64
-					if energyUj >= lastEnergy {
-						de = energyUj - lastEnergy
-					} else {
-						// Handle counter wrap
-						var maxRange uint64
-						if maxBytes, err := os.ReadFile(maxEnergyFile); err == nil {
-							maxRange, _ = strconv.ParseUint(strings.TrimSpace(string(maxBytes)), 10, 64)
-						}
-						if maxRange > 0 {
-							de = (maxRange - lastEnergy) + energyUj
-						} else {
-							de = 0
-						}
-					}
+// closeRAPLPowercap 关闭所有已打开的 energy_uj，调用方需持有 raplMu
+func (c *PowerCollector) closeRAPLPowercap() {
+	for _, d := range c.raplPowercap {
+		d.energy.Close()
+	}
+	c.raplPowercap = nil
+}
 
-					if de > 0 {
-						watts := (float64(de) / 1000000.0) / dt
-						if watts < 0 {
-							watts = 0
-						}
-						raplDomains[name] = utils.Round(watts)
-						if strings.HasPrefix(strings.ToLower(name), "package") {
-							totalWatts += watts
-						}
+// readEnergy 读取 energy_uj 的最新值
+func (d *raplPowercapDomain) readEnergy() (uint64, bool) {
+	v, ok := preadInt(d.energy)
+	if !ok || v < 0 {
+		return 0, false
+	}
+	return uint64(v), true
+}
+
+// collectRAPLPowercap 从 /sys/class/powercap 读取 RAPL 计数器（perf 不可用时的回退路径）
+func (c *PowerCollector) collectRAPLPowercap(now time.Time, raplDomains map[string]float64) (float64, bool) {
+	if c.raplPowercapScannedAt.IsZero() || now.Sub(c.raplPowercapScannedAt) > raplPowercapRescan {
+		c.scanRAPLPowercap(now)
+	}
+
+	totalWatts := 0.0
+	hasNewReading := false
+	stale := false
+
+	for i := range c.raplPowercap {
+		d := &c.raplPowercap[i]
+		energyUj, ok := d.readEnergy()
+		if !ok {
+			// 域已消失（驱动卸载等），下次采样时重新扫描
+			stale = true
+			continue
+		}
+
+		if lastEnergy, ok := c.raplReadings[d.path]; ok && !c.raplTime.IsZero() {
+			dt := now.Sub(c.raplTime).Seconds()
+			if dt > 0 {
+				var de uint64
+				if energyUj >= lastEnergy {
+					de = energyUj - lastEnergy
+				} else if d.maxRange > 0 {
+					// Handle counter wrap
+					de = (d.maxRange - lastEnergy) + energyUj
+				}
+
+				if de > 0 {
+					watts := (float64(de) / 1000000.0) / dt
+					raplDomains[d.name] = utils.Round(watts)
+					if strings.HasPrefix(strings.ToLower(d.name), "package") {
+						totalWatts += watts
 					}
 				}
 			}
-
-			c.raplReadings[domainPath] = energyUj
-			hasNewReading = true
 		}
-	}
 
-	if hasNewReading {
-		c.raplTime = now
-	}
-	if totalWatts > 0 {
-		powerStatus["consumption_watts"] = utils.Round(totalWatts)
-	}
-	if len(raplDomains) > 0 {
-		powerStatus["rapl"] = raplDomains
+		c.raplReadings[d.path] = energyUj
+		hasNewReading = true
 	}
 
-	return powerStatus
+	if stale {
+		c.raplPowercapScannedAt = time.Time{}
+	}
+	return totalWatts, hasNewReading
 }
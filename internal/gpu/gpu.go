@@ -17,6 +17,7 @@ import (
 	"time"
 
 	"github.com/AnalyseDeCircuit/opskernel/internal/config"
+	"github.com/AnalyseDeCircuit/opskernel/internal/utils"
 	"github.com/AnalyseDeCircuit/opskernel/pkg/types"
 	"github.com/NVIDIA/go-nvml/pkg/nvml"
 )
@@ -371,11 +372,7 @@ func detectGPUDriver(cardPath string) string {
 
 // readSysfsInt reads an integer value from a sysfs file
 func readSysfsInt(path string) (int64, error) {
-	data, err := os.ReadFile(path)
-	if err != nil {
-		return 0, err
-	}
-	return strconv.ParseInt(strings.TrimSpace(string(data)), 10, 64)
+	return utils.ReadProcInt(path)
 }
 
 // readSysfsFloat reads a float value from a sysfs file
@@ -548,8 +545,8 @@ func getDRMGPUInfo(startIndex int) []types.GPUDetail {
 			deviceFile = filepath.Join(cardPath, "device")
 		}
 
-		vendorBytes, err1 := os.ReadFile(vendorFile)
-		deviceBytes, err2 := os.ReadFile(deviceFile)
+		vendorBytes, err1 := utils.ReadProcFile(vendorFile, 16)
+		deviceBytes, err2 := utils.ReadProcFile(deviceFile, 16)
 
 		if err1 == nil && err2 == nil {
 			vendor := strings.ToLower(strings.TrimSpace(string(vendorBytes)))
@@ -649,8 +646,27 @@ func getDRMGPUInfo(startIndex int) []types.GPUDetail {
 	return details
 }
 
-// lookupPCIName 查找PCI设备名称
+var (
+	pciNameMu    sync.Mutex
+	pciNameCache = make(map[string]string) // "vendor:device" -> 名称（含未找到的空结果）
+)
+
+// lookupPCIName 查找PCI设备名称。pci.ids 有上万行且可能需要解压，
+// 而设备 ID 在运行期间不变，因此每个 vendor:device 只扫描一次。
 func lookupPCIName(vendorID, deviceID string) string {
+	key := vendorID + ":" + deviceID
+	pciNameMu.Lock()
+	defer pciNameMu.Unlock()
+	if name, ok := pciNameCache[key]; ok {
+		return name
+	}
+	name := scanPCIIDs(vendorID, deviceID)
+	pciNameCache[key] = name
+	return name
+}
+
+// scanPCIIDs 在 pci.ids 中查找设备名称
+func scanPCIIDs(vendorID, deviceID string) string {
 	// Try both lowercase and uppercase
 	vendorID = strings.TrimPrefix(strings.ToLower(vendorID), "0x")
 	deviceID = strings.TrimPrefix(strings.ToLower(deviceID), "0x")
@@ -748,8 +764,8 @@ func GetSimpleGPUInfo() string {
 		vendorFile := filepath.Join(cardPath, "device/vendor")
 		deviceFile := filepath.Join(cardPath, "device/device")
 
-		vendorBytes, err1 := os.ReadFile(vendorFile)
-		deviceBytes, err2 := os.ReadFile(deviceFile)
+		vendorBytes, err1 := utils.ReadProcFile(vendorFile, 16)
+		deviceBytes, err2 := utils.ReadProcFile(deviceFile, 16)
 
 		if err1 == nil && err2 == nil {
 			vendor := strings.ToLower(strings.TrimSpace(string(vendorBytes)))
@@ -3,6 +3,9 @@ package monitoring
 
 import (
 	"fmt"
+	"math/bits"
+	"strings"
+	"sync"
 	"time"
 
 	"github.com/AnalyseDeCircuit/opskernel/internal/cache"
@@ -62,24 +65,12 @@ func (s *MonitoringService) getRealSystemMetrics() (*types.SystemMetrics, error)
 		return nil, err
 	}
 
-	// 磁盘使用率 (使用 /hostfs 获取宿主机磁盘信息)
-	// 注意：如果设置了 HOST_PROC 等环境变量，gopsutil 可能会自动处理，
-	// 但 disk.Usage 需要明确的路径。
-	// 如果在容器内，/hostfs 是宿主机的根。
-	diskPath := config.Load().HostFS
-	if diskPath == "" {
-		diskPath = "/"
-	}
-	// 检查 /hostfs 是否存在，不存在则回退到 /
-	// 这里简单假设如果 Usage("/hostfs") 成功则存在
-	diskInfo, err := disk.Usage(diskPath)
+	// 磁盘使用率与分区列表来自共享的磁盘快照（15 秒刷新一次）
+	snap, err := getDiskSnapshot()
 	if err != nil {
-		// Fallback to / if /hostfs fails
-		diskInfo, err = disk.Usage("/")
-		if err != nil {
-			return nil, err
-		}
+		return nil, err
 	}
+	diskInfo := snap.root
 
 	// 检查告警 (旧版)
 	CheckAlerts(cpuPercent[0], memInfo.UsedPercent, diskInfo.UsedPercent)
@@ -112,13 +103,98 @@ func (s *MonitoringService) getRealSystemMetrics() (*types.SystemMetrics, error)
 		Timestamp:     time.Now(),
 	}
 
+	metrics.Disk = snap.disks
+
+	// Disk IO
+	ioCounters, err := disk.IOCounters()
+	if err == nil {
+		ioMap := make(map[string]types.DiskIOInfo)
+		for name, io := range ioCounters {
+			ioMap[name] = types.DiskIOInfo{
+				ReadBytes:  formatBytes(io.ReadBytes),
+				WriteBytes: formatBytes(io.WriteBytes),
+				ReadCount:  io.ReadCount,
+				WriteCount: io.WriteCount,
+				ReadTime:   io.ReadTime,
+				WriteTime:  io.WriteTime,
+			}
+		}
+		metrics.DiskIO = ioMap
+	}
+
+	return metrics, nil
+}
+
+// excludedFstypes 是不计入磁盘用量的文件系统类型：只读镜像（snap）与内存/叠加文件系统
+var excludedFstypes = map[string]struct{}{
+	"squashfs": {},
+	"tmpfs":    {},
+	"devtmpfs": {},
+	"overlay":  {},
+}
+
+// SkipPartition 判断分区是否应从磁盘用量中排除：loop 设备按 /dev/loop 前缀严格匹配，
+// 不会误伤路径中恰好包含 "loop" 的设备；文件系统类型查表判断。
+func SkipPartition(p disk.PartitionStat) bool {
+	if strings.HasPrefix(p.Device, "/dev/loop") {
+		return true
+	}
+	_, excluded := excludedFstypes[p.Fstype]
+	return excluded
+}
+
+// diskSnapshotTTL 是磁盘用量快照的复用时间。分区很少变化，而每个分区的 statfs
+// 在机械盘上可能触发寻道甚至唤醒休眠磁盘，没必要每次请求都重新统计。
+const diskSnapshotTTL = 15 * time.Second
+
+var (
+	diskSnapshotMu    sync.Mutex
+	diskSnapshotCache diskSnapshot
+)
+
+// diskSnapshot 是根文件系统与各分区用量的快照
+type diskSnapshot struct {
+	root      *disk.UsageStat
+	disks     []types.DiskInfo
+	updatedAt time.Time
+}
+
+// getDiskSnapshot 返回磁盘快照（15 秒内复用）。返回的数据为只读共享数据。
+func getDiskSnapshot() (diskSnapshot, error) {
+	diskSnapshotMu.Lock()
+	defer diskSnapshotMu.Unlock()
+
+	if diskSnapshotCache.root != nil && time.Since(diskSnapshotCache.updatedAt) < diskSnapshotTTL {
+		return diskSnapshotCache, nil
+	}
+
+	// 磁盘使用率 (使用 /hostfs 获取宿主机磁盘信息)
+	// 注意：如果设置了 HOST_PROC 等环境变量，gopsutil 可能会自动处理，
+	// 但 disk.Usage 需要明确的路径。
+	// 如果在容器内，/hostfs 是宿主机的根。
+	diskPath := config.Load().HostFS
+	if diskPath == "" {
+		diskPath = "/"
+	}
+	// 检查 /hostfs 是否存在，不存在则回退到 /
+	// 这里简单假设如果 Usage("/hostfs") 成功则存在
+	root, err := disk.Usage(diskPath)
+	if err != nil {
+		// Fallback to / if /hostfs fails
+		root, err = disk.Usage("/")
+		if err != nil {
+			return diskSnapshot{}, err
+		}
+	}
+
+	snap := diskSnapshot{root: root, updatedAt: time.Now()}
+
 	// 获取所有分区信息
 	partitions, err := disk.Partitions(false)
 	if err == nil {
-		var disks []types.DiskInfo
 		for _, p := range partitions {
 			// Skip loop devices, snaps, etc.
-			if p.Device == "" || p.Fstype == "squashfs" {
+			if p.Device == "" || SkipPartition(p) {
 				continue
 			}
 
@@ -135,7 +211,7 @@ func (s *MonitoringService) getRealSystemMetrics() (*types.SystemMetrics, error)
 				continue
 			}
 
-			disks = append(disks, types.DiskInfo{
+			snap.disks = append(snap.disks, types.DiskInfo{
 				Device:     p.Device,
 				Mountpoint: p.Mountpoint,
 				Fstype:     p.Fstype,
@@ -145,27 +221,10 @@ func (s *MonitoringService) getRealSystemMetrics() (*types.SystemMetrics, error)
 				Percent:    usage.UsedPercent,
 			})
 		}
-		metrics.Disk = disks
 	}
 
-	// Disk IO
-	ioCounters, err := disk.IOCounters()
-	if err == nil {
-		ioMap := make(map[string]types.DiskIOInfo)
-		for name, io := range ioCounters {
-			ioMap[name] = types.DiskIOInfo{
-				ReadBytes:  formatBytes(io.ReadBytes),
-				WriteBytes: formatBytes(io.WriteBytes),
-				ReadCount:  io.ReadCount,
-				WriteCount: io.WriteCount,
-				ReadTime:   io.ReadTime,
-				WriteTime:  io.WriteTime,
-			}
-		}
-		metrics.DiskIO = ioMap
-	}
-
-	return metrics, nil
+	diskSnapshotCache = snap
+	return snap, nil
 }
 
 func formatBytes(bytes uint64) string {
@@ -173,12 +232,9 @@ func formatBytes(bytes uint64) string {
 	if bytes < unit {
 		return "0 B"
 	}
-	div, exp := uint64(unit), 0
-	for n := bytes / unit; n >= unit; n /= unit {
-		div *= unit
-		exp++
-	}
-	return fmt.Sprintf("%.1f %cB", float64(bytes)/float64(div), "KMGTPE"[exp])
+	// 与 utils.GetSize 相同，单位指数由最高位直接得出
+	exp := (bits.Len64(bytes) - 1) / 10
+	return fmt.Sprintf("%.1f %cB", float64(bytes)/float64(uint64(1)<<(10*exp)), "KMGTPE"[exp-1])
 }
 
 // GetCachedMetrics 获取缓存的系统指标（不触发实时更新）
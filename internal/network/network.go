@@ -2,31 +2,43 @@
 package network
 
 import (
-	"bufio"
 	"net"
 	"os"
 	"path/filepath"
 	"strconv"
-	"strings"
+	"sync"
+	"time"
 
+	"github.com/AnalyseDeCircuit/opskernel/internal/cache"
 	"github.com/AnalyseDeCircuit/opskernel/internal/config"
 	"github.com/AnalyseDeCircuit/opskernel/internal/utils"
 	"github.com/AnalyseDeCircuit/opskernel/pkg/types"
 	gopsutilnet "github.com/shirou/gopsutil/v3/net"
 )
 
-var tcpStateMap = map[string]string{
-	"01": "ESTABLISHED",
-	"02": "SYN_SENT",
-	"03": "SYN_RECV",
-	"04": "FIN_WAIT1",
-	"05": "FIN_WAIT2",
-	"06": "TIME_WAIT",
-	"07": "CLOSE",
-	"08": "CLOSE_WAIT",
-	"09": "LAST_ACK",
-	"0A": "LISTEN",
-	"0B": "CLOSING",
+// tcpStateNames 按 Linux include/net/tcp_states.h 的状态值索引，
+// 用于把 /proc/net/tcp 第 4 列的十六进制状态直接映射为名称。
+var tcpStateNames = [...]string{
+	0x01: "ESTABLISHED",
+	0x02: "SYN_SENT",
+	0x03: "SYN_RECV",
+	0x04: "FIN_WAIT1",
+	0x05: "FIN_WAIT2",
+	0x06: "TIME_WAIT",
+	0x07: "CLOSE",
+	0x08: "CLOSE_WAIT",
+	0x09: "LAST_ACK",
+	0x0A: "LISTEN",
+	0x0B: "CLOSING",
+}
+
+// tcpStateIndex 将十六进制状态解析为 tcpStateNames 的下标，无法识别时返回 0
+func tcpStateIndex(stateHex []byte) int {
+	v, ok := parseHexBytes(stateHex, uint64(len(tcpStateNames)-1))
+	if !ok {
+		return 0
+	}
+	return int(v)
 }
 
 type procNetSummary struct {
@@ -49,34 +61,45 @@ func readProcNetSummary() (procNetSummary, error) {
 		procRoot = "/proc"
 	}
 
-	// TCP
-	for _, name := range []string{"tcp", "tcp6"} {
-		path := filepath.Join(procRoot, "net", name)
-		_ = scanProcNet(path, func(localPort int, stateHex string) {
-			out.Sockets["tcp"]++
+	// TCP (shared snapshot, also used by the SSH stats).
+	// 状态计数使用定长数组，最后再转换为 map，避免每行一次 map 查找和字符串转换。
+	var stateCounts [len(tcpStateNames)]int
+	tcpEntries, _ := getProcNetTCP()
+	for _, e := range tcpEntries {
+		if e.localPort <= 0 {
+			continue
+		}
+		out.Sockets["tcp"]++
 
-			stateName := tcpStateMap[strings.ToUpper(stateHex)]
-			if stateName == "" {
-				stateName = "UNKNOWN"
-			}
-			out.States[stateName]++
-			if stateName == "TIME_WAIT" {
-				out.Sockets["tcp_tw"]++
-			}
-			if stateName == "LISTEN" {
-				key := "tcp:" + strconv.Itoa(localPort)
-				if !seenPorts[key] {
-					seenPorts[key] = true
-					out.ListeningPort = append(out.ListeningPort, types.ListeningPort{Port: localPort, Protocol: "tcp"})
-				}
+		state := e.state
+		stateCounts[state]++
+		if tcpStateNames[state] == "LISTEN" {
+			key := "tcp:" + strconv.Itoa(e.localPort)
+			if !seenPorts[key] {
+				seenPorts[key] = true
+				out.ListeningPort = append(out.ListeningPort, types.ListeningPort{Port: e.localPort, Protocol: "tcp"})
 			}
-		})
+		}
+	}
+
+	for state, n := range stateCounts {
+		if n == 0 {
+			continue
+		}
+		stateName := tcpStateNames[state]
+		if stateName == "" {
+			stateName = "UNKNOWN"
+		}
+		out.States[stateName] += n
+	}
+	if n := out.States["TIME_WAIT"]; n > 0 {
+		out.Sockets["tcp_tw"] = n
 	}
 
 	// UDP
 	for _, name := range []string{"udp", "udp6"} {
 		path := filepath.Join(procRoot, "net", name)
-		_ = scanProcNet(path, func(localPort int, _ string) {
+		_ = scanProcNet(path, func(localPort int, _ []byte) {
 			out.Sockets["udp"]++
 			out.States["NONE"]++ // keep behavior similar to gopsutil (UDP has status NONE)
 
@@ -97,109 +120,131 @@ func readProcNetSummary() (procNetSummary, error) {
 }
 
 // scanProcNet scans /proc/net/{tcp,tcp6,udp,udp6} style files.
-// It calls onEntry(localPort, stateHex) for each row.
-func scanProcNet(path string, onEntry func(localPort int, stateHex string)) error {
-	f, err := os.Open(path)
-	if err != nil {
-		return err
-	}
-	defer f.Close()
+// It calls onEntry(localPort, stateHex) for each row. The whole file is read
+// to EOF through utils.ProcFiles and split in place; stateHex aliases the
+// read buffer and is only valid during the callback.
+func scanProcNet(path string, onEntry func(localPort int, stateHex []byte)) error {
+	return utils.ProcFiles.Read(path, 16<<10, func(data []byte) error {
+		var fields [4][]byte
+		_, data = cutLine(data) // header: sl local_address rem_address st ...
+		for len(data) > 0 {
+			var line []byte
+			line, data = cutLine(data)
+			if splitFields(line, fields[:]) < len(fields) {
+				continue
+			}
+			// local_address is like 0100007F:1F90
+			port, ok := parseHexPort(fields[1])
+			if !ok || port <= 0 {
+				continue
+			}
 
-	scanner := bufio.NewScanner(f)
-	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line == "" {
-			continue
-		}
-		fields := strings.Fields(line)
-		if len(fields) < 4 {
-			continue
-		}
-		if fields[0] == "sl" {
-			continue
-		}
-		local := fields[1]
-		stateHex := fields[3]
-		// local_address is like 0100007F:1F90
-		parts := strings.Split(local, ":")
-		if len(parts) != 2 {
-			continue
-		}
-		portHex := parts[1]
-		portU, err := strconv.ParseUint(portHex, 16, 32)
-		if err != nil {
-			continue
-		}
-		port := int(portU)
-		if port <= 0 {
-			continue
+			onEntry(port, fields[3])
 		}
+		return nil
+	})
+}
 
-		onEntry(port, stateHex)
+// GetNetworkInfo 获取完整的网络信息。
+// 结果在全局缓存中保留 cache.DefaultTTL：/api/info 与 net_detail 采集器会各自调用，
+// 连接状态、监听端口与错误计数在几秒内的变化对展示没有意义。
+// 返回值中的 map 与切片为共享数据，调用方不得修改。
+func GetNetworkInfo() (types.NetInfo, error) {
+	if cached, found := cache.GlobalMetricsCache.Get(cache.CacheKeyNetworkInfo); found {
+		if info, ok := cached.(types.NetInfo); ok {
+			return info, nil
+		}
 	}
-	if err := scanner.Err(); err != nil {
-		return err
+
+	info, err := collectNetworkInfo()
+	if err != nil {
+		return info, err
 	}
-	return nil
+	cache.GlobalMetricsCache.Set(cache.CacheKeyNetworkInfo, info, cache.DefaultTTL)
+	return info, nil
 }
 
-// GetNetworkInfo 获取完整的网络信息
-func GetNetworkInfo() (types.NetInfo, error) {
+// snmpErrorFields 是写入 NetInfo.Errors 的协议层计数（均为开机以来的累计值）
+var snmpErrorFields = []struct {
+	proto, field, key string
+}{
+	{"Ip", "InDiscards", "ip_in_discards"},
+	{"Tcp", "RetransSegs", "tcp_retrans_segs"},
+	{"Tcp", "InErrs", "tcp_in_errs"},
+	{"Tcp", "AttemptFails", "tcp_attempt_fails"},
+	{"Tcp", "OutRsts", "tcp_out_rsts"},
+	{"Udp", "InErrors", "udp_in_errors"},
+	{"Udp", "NoPorts", "udp_no_ports"},
+	{"Udp", "RcvbufErrors", "udp_rcvbuf_errors"},
+	{"Udp", "SndbufErrors", "udp_sndbuf_errors"},
+	{"TcpExt", "ListenOverflows", "tcp_listen_overflows"},
+	{"TcpExt", "ListenDrops", "tcp_listen_drops"},
+}
+
+func collectNetworkInfo() (types.NetInfo, error) {
 	info := types.NetInfo{}
 
-	// IO Counters
-	ioCounters, err := gopsutilnet.IOCounters(false)
-	if err == nil && len(ioCounters) > 0 {
-		info.RawSent = ioCounters[0].BytesSent
-		info.RawRecv = ioCounters[0].BytesRecv
+	// IO Counters: 汇总值与各接口值来自同一次 /proc/net/dev 读取
+	netDev, netDevErr := ReadNetDev()
+	if netDevErr == nil {
+		total := SumNetDev(netDev)
+		info.RawSent = total.BytesSent
+		info.RawRecv = total.BytesRecv
 
 		// Initialize Errors map
 		info.Errors = make(map[string]uint64)
-		info.Errors["total_errors_in"] = ioCounters[0].Errin
-		info.Errors["total_errors_out"] = ioCounters[0].Errout
-		info.Errors["total_drops_in"] = ioCounters[0].Dropin
-		info.Errors["total_drops_out"] = ioCounters[0].Dropout
+		info.Errors["total_errors_in"] = total.Errin
+		info.Errors["total_errors_out"] = total.Errout
+		info.Errors["total_drops_in"] = total.Dropin
+		info.Errors["total_drops_out"] = total.Dropout
 	}
 
-	// Connection States
-	if summary, err := readProcNetSummary(); err == nil {
+	// 协议层错误：/proc/net/snmp 与 /proc/net/netstat 各读一次
+	if snmp, err := ReadNetSNMP(); err == nil {
+		if info.Errors == nil {
+			info.Errors = make(map[string]uint64)
+		}
+		for _, f := range snmpErrorFields {
+			if v, ok := snmp[f.proto][f.field]; ok {
+				info.Errors[f.key] = v
+			}
+		}
+	}
+
+	// Connection States: parse /proc/net directly; gopsutil's Connections
+	// (which resolves every socket inode via /proc/<pid>/fd) is only a
+	// fallback for hosts without a readable /proc/net.
+	summary, err := readProcNetSummary()
+	if err != nil {
+		summary, err = connectionSummaryFromGopsutil()
+	}
+	if err == nil {
 		info.ConnectionStates = summary.States
 		info.Sockets = summary.Sockets
 		info.ListeningPorts = summary.ListeningPort
 	}
 
-	// Interfaces
-	ifaces, err := gopsutilnet.Interfaces()
+	// Interfaces: 名称、IP 与 up 状态来自 30 秒缓存，只有流量计数每次读取
+	ifaces, err := getInterfaceMeta()
 	if err == nil {
 		// Convert to map for frontend
-		ifaceMap := make(map[string]types.Interface)
+		ifaceMap := make(map[string]types.Interface, len(ifaces))
 
-		// Get per-interface IO counters
-		perIfaceIO, _ := gopsutilnet.IOCounters(true)
-		ioMap := make(map[string]gopsutilnet.IOCountersStat)
-		for _, io := range perIfaceIO {
+		// Per-interface IO counters
+		ioMap := make(map[string]NetDevCounters, len(netDev))
+		for _, io := range netDev {
 			ioMap[io.Name] = io
 		}
 
 		for _, iface := range ifaces {
 			stats := types.Interface{
-				IsUp: false,
-			}
-			for _, flag := range iface.Flags {
-				if flag == "up" {
-					stats.IsUp = true
-					break
-				}
-			}
-
-			for _, addr := range iface.Addrs {
-				// Simple IP extraction
-				stats.IP = addr.Addr
-				break
+				IsUp: iface.isUp,
+				IP:   iface.ip,
 			}
 
-			if io, ok := ioMap[iface.Name]; ok {
-				// 与旧版行为保持一致，使用可读的容量字符串
+			if io, ok := ioMap[iface.name]; ok {
+				// 可读字符串属于公开 API（/api/info 与 WebSocket），保持填充；
+				// 仪表盘使用原始字节数自行格式化
 				stats.BytesSent = utils.GetSize(io.BytesSent)
 				stats.BytesRecv = utils.GetSize(io.BytesRecv)
 				stats.RawSent = io.BytesSent
@@ -210,7 +255,7 @@ func GetNetworkInfo() (types.NetInfo, error) {
 				stats.DropsOut = io.Dropout
 			}
 
-			ifaceMap[iface.Name] = stats
+			ifaceMap[iface.name] = stats
 		}
 		info.Interfaces = ifaceMap
 	}
@@ -222,6 +267,56 @@ func GetNetworkInfo() (types.NetInfo, error) {
 	return info, nil
 }
 
+// interfaceMetaTTL 是网卡元数据（名称、地址、up 状态）的缓存时间。
+// 枚举网卡需要 netlink 转储和逐个 ioctl，而这些信息几乎不变。
+const interfaceMetaTTL = 30 * time.Second
+
+var (
+	interfaceMetaMu        sync.Mutex
+	interfaceMetaCache     []interfaceMeta
+	interfaceMetaUpdatedAt time.Time
+)
+
+type interfaceMeta struct {
+	name string
+	ip   string
+	isUp bool
+}
+
+// getInterfaceMeta 返回缓存的网卡元数据（30 秒内复用），返回的切片为只读共享数据
+func getInterfaceMeta() ([]interfaceMeta, error) {
+	interfaceMetaMu.Lock()
+	defer interfaceMetaMu.Unlock()
+
+	if interfaceMetaCache != nil && time.Since(interfaceMetaUpdatedAt) < interfaceMetaTTL {
+		return interfaceMetaCache, nil
+	}
+
+	ifaces, err := gopsutilnet.Interfaces()
+	if err != nil {
+		return nil, err
+	}
+	metas := make([]interfaceMeta, 0, len(ifaces))
+	for _, iface := range ifaces {
+		meta := interfaceMeta{name: iface.Name}
+		for _, flag := range iface.Flags {
+			if flag == "up" {
+				meta.isUp = true
+				break
+			}
+		}
+		if len(iface.Addrs) > 0 {
+			// Simple IP extraction
+			meta.ip = iface.Addrs[0].Addr
+		}
+		metas = append(metas, meta)
+	}
+
+	interfaceMetaCache = metas
+	interfaceMetaUpdatedAt = time.Now()
+	return metas, nil
+}
+
 // GetNetworkInterfaces 获取网络接口信息
 func GetNetworkInterfaces() ([]types.NetworkInterface, error) {
 	interfaces, err := net.Interfaces()
@@ -256,6 +351,35 @@ func GetNetworkInterfaces() ([]types.NetworkInterface, error) {
 	return result, nil
 }
 
+// connectionSummaryFromGopsutil 在无法读取 /proc/net 时通过 gopsutil 统计连接
+func connectionSummaryFromGopsutil() (procNetSummary, error) {
+	conns, err := gopsutilnet.Connections("inet")
+	if err != nil {
+		return procNetSummary{}, err
+	}
+	out := procNetSummary{
+		States:        make(map[string]int),
+		Sockets:       make(map[string]int),
+		ListeningPort: getListeningPorts(conns),
+	}
+	for _, conn := range conns {
+		switch conn.Type {
+		case 1: // SOCK_STREAM
+			out.Sockets["tcp"]++
+			if conn.Status == "TIME_WAIT" {
+				out.Sockets["tcp_tw"]++
+			}
+		case 2: // SOCK_DGRAM
+			out.Sockets["udp"]++
+		}
+		out.States[conn.Status]++
+	}
+	if out.ListeningPort == nil {
+		out.ListeningPort = make([]types.ListeningPort, 0)
+	}
+	return out, nil
+}
+
 // getListeningPorts 获取监听端口
 func getListeningPorts(conns []gopsutilnet.ConnectionStat) []types.ListeningPort {
 	var ports []types.ListeningPort
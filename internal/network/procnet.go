@@ -0,0 +1,345 @@
+package network
+
+import (
+	"bytes"
+	"path/filepath"
+	"sync"
+	"time"
+
+	"github.com/AnalyseDeCircuit/opskernel/internal/config"
+	"github.com/AnalyseDeCircuit/opskernel/internal/utils"
+	gopsutilnet "github.com/shirou/gopsutil/v3/net"
+)
+
+// procNetTCPTTL 是 /proc/net/tcp{,6} 快照的复用时间。
+// 连接状态统计、SSH 端口探测、SSH 连接计数与 inode→IP 映射都从同一份快照派生，
+// 避免每个调用方各自完整解析一遍 TCP 表。
+const procNetTCPTTL = 5 * time.Second
+
+var (
+	procNetTCPCache procNetTCPCacheEntry
+	procNetTCPLock  sync.Mutex
+)
+
+type procNetTCPCacheEntry struct {
+	updatedAt    time.Time
+	entries      []procNetTCPEntry
+	ok           bool
+	hasEverBuilt bool
+}
+
+// procNetTCPEntry 是 /proc/net/tcp 或 /proc/net/tcp6 中的一行
+type procNetTCPEntry struct {
+	localPort  int
+	remoteAddr string // 十六进制 "地址:端口"，如 0100007F:1F90
+	state      uint8  // tcpStateNames 下标，如 0x01 (ESTABLISHED)、0x0A (LISTEN)；无法识别时为 0
+	inode      string
+	isV6       bool
+}
+
+// getProcNetTCP 返回 TCP 表快照（5 秒内复用）。返回的切片为只读共享数据。
+// ok 为 false 表示 tcp 与 tcp6 都无法读取。
+func getProcNetTCP() (entries []procNetTCPEntry, ok bool) {
+	procNetTCPLock.Lock()
+	defer procNetTCPLock.Unlock()
+
+	if procNetTCPCache.hasEverBuilt && time.Since(procNetTCPCache.updatedAt) < procNetTCPTTL {
+		return procNetTCPCache.entries, procNetTCPCache.ok
+	}
+
+	v4, ok4 := readProcNetTCPFile("tcp", false)
+	v6, ok6 := readProcNetTCPFile("tcp6", true)
+	entries = append(v4, v6...)
+
+	procNetTCPCache = procNetTCPCacheEntry{
+		updatedAt:    time.Now(),
+		entries:      entries,
+		ok:           ok4 || ok6,
+		hasEverBuilt: true,
+	}
+	return entries, ok4 || ok6
+}
+
+// procNetPaths 返回 /proc/net/<name> 的候选路径：优先宿主机 proc，其次容器内 /proc
+func procNetPaths(name string) []string {
+	procRoot := "/proc"
+	if config.GlobalConfig != nil && config.GlobalConfig.HostProc != "" {
+		procRoot = config.GlobalConfig.HostProc
+	}
+	paths := []string{filepath.Join(procRoot, "net", name)}
+	if procRoot != "/proc" {
+		paths = append(paths, filepath.Join("/proc", "net", name))
+	}
+	return paths
+}
+
+// readProcNetTCPFile 通过 utils.ProcFiles 完整读取 /proc/net/tcp{,6}（读到 EOF，
+// 不受 seq_file 每次 read 约一页的限制），句柄在两次快照之间保持打开。
+func readProcNetTCPFile(name string, isV6 bool) ([]procNetTCPEntry, bool) {
+	for _, path := range procNetPaths(name) {
+		var entries []procNetTCPEntry
+		err := utils.ProcFiles.Read(path, 64<<10, func(data []byte) error {
+			// 按字节就地切分，每行只为需要保留的 remoteAddr/inode 分配字符串
+			var fields [10][]byte
+			_, data = cutLine(data) // 表头
+			for len(data) > 0 {
+				var line []byte
+				line, data = cutLine(data)
+				if splitFields(line, fields[:]) < len(fields) {
+					continue
+				}
+				// local_address is like 0100007F:1F90
+				port, ok := parseHexPort(fields[1])
+				if !ok {
+					continue
+				}
+				entries = append(entries, procNetTCPEntry{
+					localPort:  port,
+					remoteAddr: string(fields[2]),
+					state:      uint8(tcpStateIndex(fields[3])),
+					inode:      string(fields[9]),
+					isV6:       isV6,
+				})
+			}
+			return nil
+		})
+		if err != nil {
+			continue
+		}
+		return entries, true
+	}
+	return nil, false
+}
+
+// cutLine 返回 data 的第一行（不含换行符）及其后的剩余内容
+func cutLine(data []byte) (line, rest []byte) {
+	if i := bytes.IndexByte(data, '\n'); i >= 0 {
+		return data[:i], data[i+1:]
+	}
+	return data, nil
+}
+
+// splitFields 将 line 按空白切分到 dst 中，最多 len(dst) 个字段，返回字段数。
+// 与 strings.Fields 不同，它不分配内存，字段直接引用 line。
+func splitFields(line []byte, dst [][]byte) int {
+	n, i := 0, 0
+	for n < len(dst) {
+		for i < len(line) && (line[i] == ' ' || line[i] == '\t') {
+			i++
+		}
+		if i >= len(line) {
+			break
+		}
+		start := i
+		for i < len(line) && line[i] != ' ' && line[i] != '\t' {
+			i++
+		}
+		dst[n] = line[start:i]
+		n++
+	}
+	return n
+}
+
+// parseHexBytes 解析不超过 max 的十六进制无符号整数
+func parseHexBytes(b []byte, max uint64) (uint64, bool) {
+	if len(b) == 0 {
+		return 0, false
+	}
+	var v uint64
+	for _, c := range b {
+		switch {
+		case c >= '0' && c <= '9':
+			c -= '0'
+		case c >= 'A' && c <= 'F':
+			c -= 'A' - 10
+		case c >= 'a' && c <= 'f':
+			c -= 'a' - 10
+		default:
+			return 0, false
+		}
+		v = v<<4 | uint64(c)
+		if v > max {
+			return 0, false
+		}
+	}
+	return v, true
+}
+
+// parseHexPort 解析形如 0100007F:1F90 的地址中的端口
+func parseHexPort(addr []byte) (int, bool) {
+	idx := bytes.LastIndexByte(addr, ':')
+	if idx < 0 {
+		return 0, false
+	}
+	port, ok := parseHexBytes(addr[idx+1:], 0xFFFF)
+	return int(port), ok
+}
+
+// parseUintBytes 解析十进制无符号整数，非法输入返回 0
+func parseUintBytes(b []byte) uint64 {
+	var v uint64
+	for _, c := range b {
+		if c < '0' || c > '9' {
+			return 0
+		}
+		v = v*10 + uint64(c-'0')
+	}
+	return v
+}
+
+// NetDevCounters 是 /proc/net/dev 中一个接口的累计计数
+type NetDevCounters struct {
+	Name        string
+	BytesRecv   uint64
+	PacketsRecv uint64
+	Errin       uint64
+	Dropin      uint64
+	BytesSent   uint64
+	PacketsSent uint64
+	Errout      uint64
+	Dropout     uint64
+}
+
+// ReadNetDev 一次读取 /proc/net/dev（句柄保持打开，见 utils.ProcFiles），返回每个接口的计数。
+// 汇总值与各接口值来自同一份快照，不会出现两次读取之间计数变化导致的不一致；
+// 读取失败时回退到 gopsutil。
+func ReadNetDev() ([]NetDevCounters, error) {
+	var lastErr error
+	for _, path := range procNetPaths("dev") {
+		var devs []NetDevCounters
+		err := utils.ProcFiles.Read(path, 16<<10, func(data []byte) error {
+			devs = parseNetDev(data)
+			return nil
+		})
+		if err != nil {
+			lastErr = err
+			continue
+		}
+		return devs, nil
+	}
+
+	counters, err := gopsutilnet.IOCounters(true)
+	if err != nil {
+		if lastErr != nil {
+			return nil, lastErr
+		}
+		return nil, err
+	}
+	devs := make([]NetDevCounters, 0, len(counters))
+	for _, c := range counters {
+		devs = append(devs, NetDevCounters{
+			Name:        c.Name,
+			BytesRecv:   c.BytesRecv,
+			PacketsRecv: c.PacketsRecv,
+			Errin:       c.Errin,
+			Dropin:      c.Dropin,
+			BytesSent:   c.BytesSent,
+			PacketsSent: c.PacketsSent,
+			Errout:      c.Errout,
+			Dropout:     c.Dropout,
+		})
+	}
+	return devs, nil
+}
+
+// parseNetDev 解析 /proc/net/dev 内容。前两行是表头，之后每行为
+// "iface: rx_bytes rx_packets rx_errs rx_drop fifo frame compressed multicast
+// tx_bytes tx_packets tx_errs tx_drop fifo colls carrier compressed"
+func parseNetDev(data []byte) []NetDevCounters {
+	var devs []NetDevCounters
+	var fields [16][]byte
+	for len(data) > 0 {
+		var line []byte
+		line, data = cutLine(data)
+		name, rest, ok := bytes.Cut(line, []byte{':'})
+		if !ok || splitFields(rest, fields[:]) < len(fields) {
+			continue
+		}
+		devs = append(devs, NetDevCounters{
+			Name:        string(bytes.TrimSpace(name)),
+			BytesRecv:   parseUintBytes(fields[0]),
+			PacketsRecv: parseUintBytes(fields[1]),
+			Errin:       parseUintBytes(fields[2]),
+			Dropin:      parseUintBytes(fields[3]),
+			BytesSent:   parseUintBytes(fields[8]),
+			PacketsSent: parseUintBytes(fields[9]),
+			Errout:      parseUintBytes(fields[10]),
+			Dropout:     parseUintBytes(fields[11]),
+		})
+	}
+	return devs
+}
+
+// SumNetDev 汇总所有接口的计数，与 gopsutil IOCounters(false) 的口径一致（包含 lo）
+func SumNetDev(devs []NetDevCounters) NetDevCounters {
+	total := NetDevCounters{Name: "all"}
+	for _, d := range devs {
+		total.BytesRecv += d.BytesRecv
+		total.PacketsRecv += d.PacketsRecv
+		total.Errin += d.Errin
+		total.Dropin += d.Dropin
+		total.BytesSent += d.BytesSent
+		total.PacketsSent += d.PacketsSent
+		total.Errout += d.Errout
+		total.Dropout += d.Dropout
+	}
+	return total
+}
+
+// ReadNetSNMP 读取 /proc/net/snmp 与 /proc/net/netstat 中的协议计数，
+// 返回 协议 -> 字段 -> 值，如 m["Tcp"]["RetransSegs"]、m["TcpExt"]["ListenDrops"]。
+// 两个文件各读取一次；都无法读取时返回最后一个错误。
+func ReadNetSNMP() (map[string]map[string]uint64, error) {
+	out := make(map[string]map[string]uint64)
+	var lastErr error
+	found := false
+	for _, name := range []string{"snmp", "netstat"} {
+		for _, path := range procNetPaths(name) {
+			data, err := utils.ReadProcFile(path, 8<<10)
+			if err != nil {
+				lastErr = err
+				continue
+			}
+			parseNetSNMP(data, out)
+			found = true
+			break
+		}
+	}
+	if !found {
+		return nil, lastErr
+	}
+	return out, nil
+}
+
+// parseNetSNMP 解析 snmp/netstat 格式：每个协议占两行，首行为字段名，次行为对应的值，
+// 如 "Tcp: RtoAlgorithm RtoMin ..." 与 "Tcp: 1 200 ..."。负值（如 Tcp MaxConn 的 -1）记为 0。
+func parseNetSNMP(data []byte, out map[string]map[string]uint64) {
+	var names, values [256][]byte // TcpExt 在新内核上已超过 130 个字段
+	for len(data) > 0 {
+		var header, row []byte
+		header, data = cutLine(data)
+		row, data = cutLine(data)
+
+		proto, headerRest, ok := bytes.Cut(header, []byte{':'})
+		if !ok {
+			continue
+		}
+		rowProto, rowRest, ok := bytes.Cut(row, []byte{':'})
+		if !ok || !bytes.Equal(proto, rowProto) {
+			continue
+		}
+
+		n := splitFields(headerRest, names[:])
+		if m := splitFields(rowRest, values[:]); m < n {
+			n = m
+		}
+		fields := out[string(proto)]
+		if fields == nil {
+			fields = make(map[string]uint64, n)
+			out[string(proto)] = fields
+		}
+		for i := 0; i < n; i++ {
+			fields[string(names[i])] = parseUintBytes(values[i])
+		}
+	}
+}
@@ -0,0 +1,58 @@
+package network
+
+import (
+	"testing"
+)
+
+// snmpSample 截取自 /proc/net/snmp（字段有删减，格式不变）
+const snmpSample = `Ip: Forwarding DefaultTTL InReceives InHdrErrors InAddrErrors ForwDatagrams InUnknownProtos InDiscards InDelivers
+Ip: 2 64 9428 0 0 0 0 3 9428
+Tcp: RtoAlgorithm RtoMin RtoMax MaxConn ActiveOpens PassiveOpens AttemptFails EstabResets CurrEstab InSegs OutSegs RetransSegs InErrs OutRsts InCsumErrors
+Tcp: 1 200 120000 -1 31 12 2 0 4 8899 8876 17 1 5 0
+Udp: InDatagrams NoPorts InErrors OutDatagrams RcvbufErrors SndbufErrors InCsumErrors IgnoredMulti MemErrors
+Udp: 530 6 2 536 1 0 0 0 0
+`
+
+// netstatSample 截取自 /proc/net/netstat
+const netstatSample = `TcpExt: SyncookiesSent SyncookiesRecv SyncookiesFailed EmbryonicRsts PruneCalled RcvPruned OfoPruned OutOfWindowIcmps LockDroppedIcmps ArpFilter TW TWRecycled TWKilled PAWSActive PAWSEstab DelayedACKs DelayedACKLocked DelayedACKLost ListenOverflows ListenDrops
+TcpExt: 0 0 0 0 0 0 0 0 0 0 9 0 0 0 0 24 0 0 7 11
+IpExt: InNoRoutes InTruncatedPkts InMcastPkts
+IpExt: 0 0 4
+`
+
+func TestParseNetSNMP(t *testing.T) {
+	tests := []struct {
+		name     string
+		input    string
+		proto    string
+		field    string
+		expected uint64
+		found    bool
+	}{
+		{"Tcp 重传", snmpSample, "Tcp", "RetransSegs", 17, true},
+		{"Tcp 最后一列", snmpSample, "Tcp", "InCsumErrors", 0, true},
+		{"负值记为 0", snmpSample, "Tcp", "MaxConn", 0, true},
+		{"Ip 丢弃", snmpSample, "Ip", "InDiscards", 3, true},
+		{"Udp 错误", snmpSample, "Udp", "InErrors", 2, true},
+		{"netstat 监听丢弃", netstatSample, "TcpExt", "ListenDrops", 11, true},
+		{"netstat 第二个协议", netstatSample, "IpExt", "InMcastPkts", 4, true},
+		{"不存在的字段", snmpSample, "Tcp", "NoSuchField", 0, false},
+		{"协议不匹配", "Tcp: InErrs OutRsts\nUdp: 1 2\n", "Tcp", "InErrs", 0, false},
+		{"值行短于表头-已有值", "Udp: InErrors NoPorts RcvbufErrors\nUdp: 1 2\n", "Udp", "NoPorts", 2, true},
+		{"值行短于表头-缺失值", "Udp: InErrors NoPorts RcvbufErrors\nUdp: 1 2\n", "Udp", "RcvbufErrors", 0, false},
+		{"缺少结尾换行", "Udp: InErrors\nUdp: 9", "Udp", "InErrors", 9, true},
+		{"空输入", "", "Tcp", "InErrs", 0, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			out := make(map[string]map[string]uint64)
+			parseNetSNMP([]byte(tt.input), out)
+			result, ok := out[tt.proto][tt.field]
+			if ok != tt.found || result != tt.expected {
+				t.Errorf("parseNetSNMP()[%s][%s] = %v, %v, expected %v, %v",
+					tt.proto, tt.field, result, ok, tt.expected, tt.found)
+			}
+		})
+	}
+}
@@ -1,17 +1,19 @@
 package network
 
 import (
-	"bufio"
+	"bytes"
 	"crypto/sha256"
 	"encoding/base64"
 	"encoding/binary"
 	"encoding/hex"
+	"io"
 	stdnet "net"
 	"os"
 	"path/filepath"
 	"strconv"
 	"strings"
 	"sync"
+	"syscall"
 	"time"
 
 	"github.com/AnalyseDeCircuit/opskernel/internal/config"
@@ -24,12 +26,13 @@ var (
 	sshMemCache      sshMemCacheEntry
 	sshAuthCache     sshAuthCacheEntry
 	sshIdentityCache sshIdentityCacheEntry
-	sshAuthLogOffset int64
+	sshAuthLog       sshAuthLogTail
 	sshAuthCounters  = map[string]int{"publickey": 0, "password": 0, "other": 0, "failed": 0}
 	sshStatsLock     sync.Mutex
 	clkTckCache      int64
 	hostMemTotalOnce sync.Once
 	hostMemTotalByte uint64
+	knownHostsCounts = map[string]knownHostsCountEntry{}
 )
 
 type sshConnCacheEntry struct {
@@ -58,6 +61,13 @@ type sshAuthCacheEntry struct {
 	hasEverBuilt    bool
 }
 
+// knownHostsCountEntry 缓存 known_hosts 的行数，文件 mtime/size 未变化时不再重新读取
+type knownHostsCountEntry struct {
+	modTime time.Time
+	size    int64
+	count   int
+}
+
 type sshIdentityCacheEntry struct {
 	updatedAt    time.Time
 	hostKey      string
@@ -218,12 +228,9 @@ func GetSSHStatsWithOptions(force bool) types.SSHStats {
 			if p == "" {
 				continue
 			}
-			if content, err := os.ReadFile(p); err == nil {
-				lines := strings.Split(strings.TrimSpace(string(content)), "\n")
-				if len(lines) > 0 {
-					historySize = len(lines)
-					break
-				}
+			if n, ok := countKnownHostsLines(p); ok {
+				historySize = n
+				break
 			}
 		}
 
@@ -470,78 +477,113 @@ func computeSSHKeyFingerprint(keyFile string) string {
 	return "SHA256:" + fingerprint + " (" + typeName + ")"
 }
 
-func checkPort22Open() bool {
-	// Read /proc/net/tcp directly (no exec needed)
-	// Port 22 is 0016 in hex. State 0A is LISTEN.
-	checkProc := func(path string) bool {
-		content, err := os.ReadFile(path)
-		if err != nil {
-			return false
-		}
-		lines := strings.Split(string(content), "\n")
-		for _, line := range lines {
-			fields := strings.Fields(line)
-			if len(fields) < 4 {
-				continue
-			}
-			localAddr := fields[1]
-			state := fields[3]
-			if strings.HasSuffix(localAddr, ":0016") && state == "0A" {
-				return true
-			}
-		}
-		return false
-	}
-
-	// Check both host and container proc
-	return checkProc(config.HostPath("/proc/net/tcp")) ||
-		checkProc("/proc/net/tcp") ||
-		checkProc(config.HostPath("/proc/net/tcp6")) ||
-		checkProc("/proc/net/tcp6")
-}
-
-func getSSHConnectionCount() int {
-	// Check /proc/net/tcp and tcp6 for port 22 connections
-	count := 0
-	// Try host proc first if available
-	if c := countSSHConnectionsFromProc(config.HostPath("/proc/net/tcp")); c > 0 {
-		count += c
-	} else if c := countSSHConnectionsFromProc("/proc/net/tcp"); c > 0 {
-		count += c
+// countKnownHostsLines 返回 known_hosts 的条目行数（去掉首尾空白后按换行计数），
+// 以 mtime+size 为键缓存结果。调用方需持有 sshStatsLock。
+func countKnownHostsLines(path string) (int, bool) {
+	st, err := os.Stat(path)
+	if err != nil {
+		return 0, false
 	}
-
-	if c := countSSHConnectionsFromProc(config.HostPath("/proc/net/tcp6")); c > 0 {
-		count += c
-	} else if c := countSSHConnectionsFromProc("/proc/net/tcp6"); c > 0 {
-		count += c
+	if cached, ok := knownHostsCounts[path]; ok && cached.modTime.Equal(st.ModTime()) && cached.size == st.Size() {
+		return cached.count, true
 	}
-	return count
-}
 
-func countSSHConnectionsFromProc(path string) int {
 	content, err := os.ReadFile(path)
 	if err != nil {
-		return 0
+		return 0, false
 	}
-	lines := strings.Split(string(content), "\n")
-	count := 0
-	for _, line := range lines {
-		fields := strings.Fields(line)
-		if len(fields) < 4 {
-			continue
+	count := bytes.Count(bytes.TrimSpace(content), []byte{'\n'}) + 1
+	knownHostsCounts[path] = knownHostsCountEntry{modTime: st.ModTime(), size: st.Size(), count: count}
+	return count, true
+}
+
+func checkPort22Open() bool {
+	// Port 22 in LISTEN (0A) state, from the shared /proc/net/tcp{,6} snapshot
+	entries, _ := getProcNetTCP()
+	for _, e := range entries {
+		if e.localPort == 22 && e.state == 0x0A {
+			return true
 		}
-		// local_address is field 1 (0-indexed)
-		localAddr := fields[1]
-		state := fields[3]
+	}
+	return false
+}
 
-		// Port 22 is 0016 in hex
-		if strings.HasSuffix(localAddr, ":0016") && state == "01" { // 01 is ESTABLISHED
+func getSSHConnectionCount() int {
+	// ESTABLISHED (01) connections on local port 22
+	entries, _ := getProcNetTCP()
+	count := 0
+	for _, e := range entries {
+		if e.localPort == 22 && e.state == 0x01 {
 			count++
 		}
 	}
 	return count
 }
 
+// sshAuthLogTailBytes 是每次最多处理的 auth.log 字节数：首次启动或日志轮转时
+// 只读取末尾这一段，而不是从头扫描可能数 MB 的日志。
+const sshAuthLogTailBytes = 64 << 10
+
+// sshAuthLogTail 记录 auth.log 已处理到的位置，用于增量读取
+type sshAuthLogTail struct {
+	offset int64  // 下一次读取的起始偏移（总是位于行首）
+	inode  uint64 // 上次读取时文件的 inode，用于识别轮转
+	seen   bool   // 是否已读取过（首次只读取末尾一段）
+}
+
+// next 根据文件当前的 size 与 inode 决定读取范围，从 r 读取新增内容，
+// 返回其中完整的行（以 '\n' 结尾）以及更新后的读取位置：
+//   - 首次读取只看末尾 sshAuthLogTailBytes，且跳过可能不完整的第一行；
+//   - inode 变化（轮转）或文件变短（截断）时从头读取；
+//   - 积压超过 sshAuthLogTailBytes 时只处理最后一段；
+//   - 末尾尚未写完的行不消费，下次重新读取。
+func (t sshAuthLogTail) next(r io.ReaderAt, size int64, inode uint64) ([]byte, sshAuthLogTail, error) {
+	prevOffset := t.offset
+	offset := t.offset
+	switch {
+	case !t.seen:
+		// First run: only look at the tail of the existing log
+		offset = size - sshAuthLogTailBytes
+	case inode != t.inode || size < offset:
+		// Rotated (new inode) or truncated: everything in the file is new
+		offset = 0
+	}
+	t.inode = inode
+	t.seen = true
+	// 积压过多时只处理最后一段
+	if size-offset > sshAuthLogTailBytes {
+		offset = size - sshAuthLogTailBytes
+	}
+	if offset < 0 {
+		offset = 0
+	}
+	// 从文件中间开始读取时，第一行可能不完整，需要跳过
+	skipPartial := offset > 0 && offset != prevOffset
+	if offset >= size {
+		t.offset = offset
+		return nil, t, nil
+	}
+
+	buf := make([]byte, size-offset)
+	n, err := r.ReadAt(buf, offset)
+	if err != nil && err != io.EOF {
+		return nil, t, err
+	}
+	buf = buf[:n]
+
+	// Only consume complete lines; a partially written last line is read again next time
+	consumed := bytes.LastIndexByte(buf, '\n') + 1
+	if consumed == 0 {
+		return nil, t, nil
+	}
+	t.offset = offset + int64(consumed)
+	data := buf[:consumed]
+	if skipPartial {
+		data = data[bytes.IndexByte(data, '\n')+1:]
+	}
+	return data, t, nil
+}
+
 func updateSSHAuthStats() {
 	logPath := config.HostPath("/var/log/auth.log")
 	file, err := os.Open(logPath)
@@ -555,35 +597,64 @@ func updateSSHAuthStats() {
 		return
 	}
 
-	// If file truncated, reset offset
-	if stat.Size() < sshAuthLogOffset {
-		sshAuthLogOffset = 0
-		// Reset counters too? Maybe not, to keep history.
+	data, next, err := sshAuthLog.next(file, stat.Size(), fileInode(stat))
+	sshAuthLog = next
+	if err != nil {
+		return
 	}
 
-	if _, err := file.Seek(sshAuthLogOffset, 0); err != nil {
-		return
+	for len(data) > 0 {
+		var line []byte
+		if idx := bytes.IndexByte(data, '\n'); idx >= 0 {
+			line, data = data[:idx], data[idx+1:]
+		} else {
+			line, data = data, nil
+		}
+		classifySSHAuthLine(line)
 	}
+}
 
-	scanner := bufio.NewScanner(file)
-	for scanner.Scan() {
-		line := scanner.Text()
-		sshAuthLogOffset += int64(len(line) + 1) // +1 for newline
+var (
+	sshdTag            = []byte("sshd")
+	sshAcceptedTag     = []byte("Accepted ")
+	sshFailedPassword  = []byte("Failed password")
+	sshClosedAuthUser  = []byte("Connection closed by authenticating user")
+	sshMethodPublickey = []byte("publickey ")
+	sshMethodPassword  = []byte("password ")
+)
 
-		if !strings.Contains(line, "sshd") {
-			continue
-		}
+// classifySSHAuthLine 根据一行 auth.log 更新认证方式计数。
+// 成功登录只查找一次 "Accepted "，再比较其后的认证方式单词，
+// 而不是对 publickey/password/其他 各做一次全行子串搜索。
+func classifySSHAuthLine(line []byte) {
+	if !bytes.Contains(line, sshdTag) {
+		return
+	}
 
-		if strings.Contains(line, "Accepted publickey") {
+	if idx := bytes.Index(line, sshAcceptedTag); idx >= 0 {
+		method := line[idx+len(sshAcceptedTag):]
+		switch {
+		case bytes.HasPrefix(method, sshMethodPublickey):
 			sshAuthCounters["publickey"]++
-		} else if strings.Contains(line, "Accepted password") {
+		case bytes.HasPrefix(method, sshMethodPassword):
 			sshAuthCounters["password"]++
-		} else if strings.Contains(line, "Accepted") {
+		default:
 			sshAuthCounters["other"]++
-		} else if strings.Contains(line, "Failed password") || strings.Contains(line, "Connection closed by authenticating user") {
-			sshAuthCounters["failed"]++
 		}
+		return
+	}
+
+	if bytes.Contains(line, sshFailedPassword) || bytes.Contains(line, sshClosedAuthUser) {
+		sshAuthCounters["failed"]++
+	}
+}
+
+// fileInode 返回文件的 inode 号，用于识别日志轮转
+func fileInode(fi os.FileInfo) uint64 {
+	if st, ok := fi.Sys().(*syscall.Stat_t); ok {
+		return uint64(st.Ino)
 	}
+	return 0
 }
 
 func getSSHSessionsFromWho() []types.SSHSession {
@@ -846,54 +917,21 @@ func parseSSHDUser(arg0 string) string {
 
 func buildSSHRemoteIPByInode() map[string]string {
 	remoteIPByInode := make(map[string]string)
-	for _, p := range []string{config.HostPath("/proc/net/tcp"), "/proc/net/tcp"} {
-		mergeSSHRemoteIPByInode(remoteIPByInode, p, false)
-		if len(remoteIPByInode) > 0 {
-			break
-		}
-	}
-	for _, p := range []string{config.HostPath("/proc/net/tcp6"), "/proc/net/tcp6"} {
-		mergeSSHRemoteIPByInode(remoteIPByInode, p, true)
-	}
-	return remoteIPByInode
-}
-
-func mergeSSHRemoteIPByInode(dst map[string]string, path string, isV6 bool) {
-	content, err := os.ReadFile(path)
-	if err != nil {
-		return
-	}
-	lines := strings.Split(string(content), "\n")
-	for _, line := range lines {
-		fields := strings.Fields(line)
-		if len(fields) < 10 {
+	entries, _ := getProcNetTCP()
+	for _, e := range entries {
+		// ESTABLISHED (01) connections on local port 22
+		if e.localPort != 22 || e.state != 0x01 || e.inode == "" {
 			continue
 		}
-		localAddr := fields[1]
-		remoteAddr := fields[2]
-		state := fields[3]
-		inode := fields[9]
-
-		if inode == "" {
-			continue
-		}
-		// Port 22 is 0016 in hex
-		if !strings.HasSuffix(localAddr, ":0016") {
-			continue
-		}
-		// 01 is ESTABLISHED
-		if state != "01" {
-			continue
-		}
-
-		ip, ok := parseProcNetIP(remoteAddr, isV6)
+		ip, ok := parseProcNetIP(e.remoteAddr, e.isV6)
 		if !ok {
 			continue
 		}
-		if _, exists := dst[inode]; !exists {
-			dst[inode] = ip
+		if _, exists := remoteIPByInode[e.inode]; !exists {
+			remoteIPByInode[e.inode] = ip
 		}
 	}
+	return remoteIPByInode
 }
 
 func parseProcNetIP(addrPort string, isV6 bool) (string, bool) {
@@ -0,0 +1,54 @@
+package network
+
+import (
+	"bytes"
+	"fmt"
+	"strings"
+	"testing"
+)
+
+func TestSSHAuthLogTailNext(t *testing.T) {
+	// 8000 行、每行 10 字节，共 80000 字节，超过 sshAuthLogTailBytes（65536）。
+	// 窗口起点 80000-65536=14464 落在第 1446 行中间，该行应被跳过。
+	var big strings.Builder
+	for i := 0; i < 8000; i++ {
+		fmt.Fprintf(&big, "l%08d\n", i)
+	}
+	bigLog := big.String()
+	bigTail := bigLog[1447*10:]
+
+	tests := []struct {
+		name       string
+		state      sshAuthLogTail
+		content    string
+		inode      uint64
+		wantLines  string
+		wantOffset int64
+	}{
+		{"首次读取小文件", sshAuthLogTail{}, "a\nb\n", 1, "a\nb\n", 4},
+		{"首次读取只看末尾窗口", sshAuthLogTail{}, bigLog, 1, bigTail, 80000},
+		{"增量读取", sshAuthLogTail{offset: 4, inode: 1, seen: true}, "a\nb\nc\n", 1, "c\n", 6},
+		{"无新增内容", sshAuthLogTail{offset: 6, inode: 1, seen: true}, "a\nb\nc\n", 1, "", 6},
+		{"末尾未写完的行留到下次", sshAuthLogTail{offset: 4, inode: 1, seen: true}, "a\nb\nc\nd", 1, "c\n", 6},
+		{"只有未写完的行", sshAuthLogTail{offset: 4, inode: 1, seen: true}, "a\nb\nc", 1, "", 4},
+		{"轮转后从头读取", sshAuthLogTail{offset: 4, inode: 1, seen: true}, "new1\nnew2\n", 2, "new1\nnew2\n", 10},
+		{"截断后从头读取", sshAuthLogTail{offset: 100, inode: 1, seen: true}, "t\n", 1, "t\n", 2},
+		{"积压超过窗口只处理最后一段", sshAuthLogTail{offset: 0, inode: 1, seen: true}, bigLog, 1, bigTail, 80000},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			r := bytes.NewReader([]byte(tt.content))
+			lines, next, err := tt.state.next(r, int64(len(tt.content)), tt.inode)
+			if err != nil {
+				t.Fatalf("next() error = %v", err)
+			}
+			if string(lines) != tt.wantLines {
+				t.Errorf("next() lines = %.40q (len %d), expected %.40q (len %d)", lines, len(lines), tt.wantLines, len(tt.wantLines))
+			}
+			if next.offset != tt.wantOffset || next.inode != tt.inode || !next.seen {
+				t.Errorf("next() state = %+v, expected offset %d inode %d seen", next, tt.wantOffset, tt.inode)
+			}
+		})
+	}
+}
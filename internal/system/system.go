@@ -10,6 +10,7 @@ import (
 	"path/filepath"
 	"runtime"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/AnalyseDeCircuit/opskernel/internal/config"
@@ -37,17 +38,48 @@ type StaticInfo struct {
 	EnabledModules map[string]bool `json:"enabled_modules"`
 }
 
+// hostIdentity 是运行期间不会变化的系统信息。获取它们需要执行 chroot/uname、
+// 读取 os-release、cpuinfo、shells 以及扫描 pci.ids，因此只在首次请求时计算一次。
+type hostIdentity struct {
+	hostname string
+	os       string
+	kernel   string
+	shell    string
+	cpu      string
+	gpu      string
+}
+
+var (
+	hostIdentityOnce  sync.Once
+	hostIdentityCache hostIdentity
+)
+
+func getHostIdentity() hostIdentity {
+	hostIdentityOnce.Do(func() {
+		hostIdentityCache = hostIdentity{
+			hostname: getHostname(),
+			os:       getOSInfo(),
+			kernel:   getKernelVersion(),
+			shell:    getShell(),
+			cpu:      getCPUModel(),
+			gpu:      gpu.GetSimpleGPUInfo(),
+		}
+	})
+	return hostIdentityCache
+}
+
 // GetStaticInfo 获取静态系统信息
 func GetStaticInfo() *StaticInfo {
 	cfg := config.Load()
+	id := getHostIdentity()
 	info := &StaticInfo{
-		Header: getHostname(),
-		OS:     getOSInfo(),
-		Kernel: getKernelVersion(),
+		Header: id.hostname,
+		OS:     id.os,
+		Kernel: id.kernel,
 		Uptime: getUptime(),
-		Shell:  getShell(),
-		CPU:    getCPUModel(),
-		GPU:    gpu.GetSimpleGPUInfo(),
+		Shell:  id.shell,
+		CPU:    id.cpu,
+		GPU:    id.gpu,
 		Memory: getMemoryInfo(),
 		Swap:   getSwapInfo(),
 		Disk:   getDiskInfo(),
@@ -302,7 +334,28 @@ func getDiskInfo() string {
 	return "Unknown"
 }
 
+// localIPTTL 是本机 IP 的缓存时间。地址几乎不变，没必要每次 /api/info 都做一次 netlink 地址转储
+const localIPTTL = 60 * time.Second
+
+var (
+	localIPMu        sync.Mutex
+	localIPCache     string
+	localIPUpdatedAt time.Time
+)
+
 func getLocalIP() string {
+	localIPMu.Lock()
+	defer localIPMu.Unlock()
+
+	if localIPCache != "" && time.Since(localIPUpdatedAt) < localIPTTL {
+		return localIPCache
+	}
+	localIPCache = lookupLocalIP()
+	localIPUpdatedAt = time.Now()
+	return localIPCache
+}
+
+func lookupLocalIP() string {
 	addrs, err := net.InterfaceAddrs()
 	if err != nil {
 		return "Unknown"
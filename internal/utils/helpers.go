@@ -4,6 +4,7 @@ package utils
 import (
 	"fmt"
 	"math"
+	"math/bits"
 	"net"
 	"regexp"
 	"strconv"
@@ -16,17 +17,13 @@ func Round(val float64) float64 {
 }
 
 // GetSize 将字节数格式化为可读的字符串
+// 单位指数由最高位直接得出（每 10 位一级），无需循环除以 1024
 func GetSize(bytes uint64) string {
-	const unit = 1024
-	if bytes < unit {
+	if bytes < 1024 {
 		return fmt.Sprintf("%d B", bytes)
 	}
-	div, exp := int64(unit), 0
-	for n := bytes / unit; n >= unit; n /= unit {
-		div *= unit
-		exp++
-	}
-	return fmt.Sprintf("%.2f %ciB", float64(bytes)/float64(div), "KMGTPE"[exp])
+	exp := (bits.Len64(bytes) - 1) / 10
+	return fmt.Sprintf("%.2f %ciB", float64(bytes)/float64(uint64(1)<<(10*exp)), "KMGTPE"[exp-1])
 }
 
 // FormatUptime 将秒数格式化为可读的uptime字符串
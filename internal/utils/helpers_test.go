@@ -40,6 +40,10 @@ func TestGetSize(t *testing.T) {
 		{"1MB", 1024 * 1024, "1.00 MiB"},
 		{"1GB", 1024 * 1024 * 1024, "1.00 GiB"},
 		{"1.5GB", 1024 * 1024 * 1024 * 3 / 2, "1.50 GiB"},
+		{"1KB以下边界", 1023, "1023 B"},
+		{"1MB以下边界", 1024*1024 - 1, "1024.00 KiB"},
+		{"1TB", 1 << 40, "1.00 TiB"},
+		{"最大值", ^uint64(0), "16.00 EiB"},
 	}
 
 	for _, tt := range tests {
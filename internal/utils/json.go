@@ -0,0 +1,46 @@
+package utils
+
+import (
+	"bytes"
+	"encoding/json"
+	"sync"
+)
+
+// jsonBufMaxPooled 超过该容量的缓冲区不放回池中，避免偶发的大响应长期占用内存
+const jsonBufMaxPooled = 1 << 20
+
+var jsonBufPool = sync.Pool{
+	New: func() interface{} { return new(bytes.Buffer) },
+}
+
+// MarshalJSON 使用池化缓冲区序列化 v，且不对 <、>、& 做 HTML 转义。
+// 仅用于 WebSocket 推送的监控快照：这些消息只会被前端 JSON.parse 消费，
+// 转义只会让 cmdline 等字段更长、编码更慢。HTTP 响应（日志、错误信息等）
+// 应使用保留转义的 MarshalJSONEscaped。
+func MarshalJSON(v interface{}) ([]byte, error) {
+	return marshalJSON(v, false)
+}
+
+// MarshalJSONEscaped 与 MarshalJSON 相同，但保留 encoding/json 默认的 HTML 转义
+func MarshalJSONEscaped(v interface{}) ([]byte, error) {
+	return marshalJSON(v, true)
+}
+
+// marshalJSON 使用池化缓冲区序列化 v，省去每次序列化时缓冲区的反复扩容
+func marshalJSON(v interface{}, escapeHTML bool) ([]byte, error) {
+	buf := jsonBufPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	defer func() {
+		if buf.Cap() <= jsonBufMaxPooled {
+			jsonBufPool.Put(buf)
+		}
+	}()
+
+	enc := json.NewEncoder(buf)
+	enc.SetEscapeHTML(escapeHTML)
+	if err := enc.Encode(v); err != nil {
+		return nil, err
+	}
+	// Encoder 会追加换行符，与 json.Marshal 的输出保持一致
+	return bytes.Clone(bytes.TrimSuffix(buf.Bytes(), []byte{'\n'})), nil
+}
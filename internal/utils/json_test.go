@@ -0,0 +1,35 @@
+package utils
+
+import (
+	"testing"
+)
+
+func TestMarshalJSON(t *testing.T) {
+	tests := []struct {
+		name     string
+		input    interface{}
+		escape   bool
+		expected string
+	}{
+		{"对象", map[string]int{"a": 1}, false, `{"a":1}`},
+		{"不转义HTML字符", map[string]string{"cmd": "a && b <c>"}, false, `{"cmd":"a && b <c>"}`},
+		{"空切片", []int{}, false, `[]`},
+		{"转义HTML字符", map[string]string{"log": "<script>&"}, true, `{"log":"\u003cscript\u003e\u0026"}`},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			marshal := MarshalJSON
+			if tt.escape {
+				marshal = MarshalJSONEscaped
+			}
+			result, err := marshal(tt.input)
+			if err != nil {
+				t.Fatalf("MarshalJSON() error = %v", err)
+			}
+			if string(result) != tt.expected {
+				t.Errorf("MarshalJSON(%v) = %s, expected %s", tt.input, result, tt.expected)
+			}
+		})
+	}
+}
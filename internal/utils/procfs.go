@@ -0,0 +1,193 @@
+package utils
+
+import (
+	"bytes"
+	"errors"
+	"io"
+	"os"
+	"strconv"
+	"sync"
+)
+
+// ReadProcFile 读取 /proc 或 /sys 下由内核按需生成的文件。
+// 这类文件 Stat 得到的大小为 0，os.ReadFile 会从 512 字节开始反复扩容；
+// 这里按 sizeHint 一次分配缓冲区，减少扩容与拷贝。
+// 注意 seq_file 每次 read 最多只返回约一页内容（与缓冲区大小无关），
+// 短读并不代表文件结束，因此必须一直读到 io.EOF。
+func ReadProcFile(path string, sizeHint int) ([]byte, error) {
+	f, err := os.Open(path)
+	if err != nil {
+		return nil, err
+	}
+	defer f.Close()
+
+	if sizeHint <= 0 {
+		sizeHint = 4096
+	}
+	buf := make([]byte, 0, sizeHint)
+	for {
+		if len(buf) == cap(buf) {
+			buf = append(buf, 0)[:len(buf)]
+		}
+		n, err := f.Read(buf[len(buf):cap(buf)])
+		buf = buf[:len(buf)+n]
+		if err == io.EOF {
+			return buf, nil
+		}
+		if err != nil {
+			return nil, err
+		}
+		if n == 0 {
+			return buf, nil
+		}
+	}
+}
+
+// ProcFiles 保存高频读取的 /proc 文件句柄（/proc/stat、/proc/net/dev 等），
+// 采集器停止时调用 Close 释放；之后的读取会按需重新打开。
+var ProcFiles = NewProcFileCache()
+
+// ProcFileCache 让 /proc 文件在多次读取之间保持打开，每次用 pread 从偏移 0
+// 重新读取：seq_file 在偏移 0 处会重新生成内容，因此结果与重新 open 一致，
+// 但省去了每次的 open/close 和路径解析。
+type ProcFileCache struct {
+	mu    sync.Mutex
+	files map[string]*procFileEntry
+}
+
+type procFileEntry struct {
+	mu  sync.Mutex
+	f   *os.File
+	buf []byte
+}
+
+// NewProcFileCache 创建一个空的句柄缓存
+func NewProcFileCache() *ProcFileCache {
+	return &ProcFileCache{files: make(map[string]*procFileEntry)}
+}
+
+// Read 读取 path 的完整内容并交给 fn 处理。data 指向内部复用的缓冲区，
+// 只在 fn 执行期间有效，fn 不得保留它。同一路径的读取互斥执行。
+func (c *ProcFileCache) Read(path string, sizeHint int, fn func(data []byte) error) error {
+	e, err := c.entry(path, sizeHint)
+	if err != nil {
+		return err
+	}
+	defer e.mu.Unlock()
+
+	n := 0
+	for {
+		m, err := e.f.ReadAt(e.buf[n:], int64(n))
+		n += m
+		if err == io.EOF || (err == nil && n < len(e.buf)) {
+			break
+		}
+		if err != nil {
+			c.drop(path, e)
+			return err
+		}
+		// 缓冲区被填满，内容可能更长：扩容后继续读取剩余部分
+		e.buf = append(e.buf, make([]byte, len(e.buf))...)
+	}
+	return fn(e.buf[:n])
+}
+
+// entry 返回 path 对应的已打开条目，返回时已持有 e.mu
+func (c *ProcFileCache) entry(path string, sizeHint int) (*procFileEntry, error) {
+	for {
+		c.mu.Lock()
+		e, ok := c.files[path]
+		if !ok {
+			f, err := os.Open(path)
+			if err != nil {
+				c.mu.Unlock()
+				return nil, err
+			}
+			if sizeHint <= 0 {
+				sizeHint = 4096
+			}
+			e = &procFileEntry{f: f, buf: make([]byte, sizeHint)}
+			c.files[path] = e
+		}
+		c.mu.Unlock()
+
+		e.mu.Lock()
+		if e.f != nil {
+			return e, nil
+		}
+		// 条目已被 Close/drop 关闭并移出缓存，重新打开
+		e.mu.Unlock()
+	}
+}
+
+// drop 关闭读取出错的句柄，下次读取时重新打开。调用方需持有 e.mu。
+func (c *ProcFileCache) drop(path string, e *procFileEntry) {
+	c.mu.Lock()
+	if c.files[path] == e {
+		delete(c.files, path)
+	}
+	c.mu.Unlock()
+	e.f.Close()
+	e.f = nil
+}
+
+// Close 关闭所有缓存的句柄
+func (c *ProcFileCache) Close() {
+	c.mu.Lock()
+	files := c.files
+	c.files = make(map[string]*procFileEntry)
+	c.mu.Unlock()
+
+	for _, e := range files {
+		e.mu.Lock()
+		if e.f != nil {
+			e.f.Close()
+			e.f = nil
+		}
+		e.mu.Unlock()
+	}
+}
+
+// ReadProcInt 读取只包含一个整数的 sysfs/procfs 文件（如 energy_uj、power_now），
+// 使用栈上缓冲区并直接解析字节，不经过字符串转换。
+func ReadProcInt(path string) (int64, error) {
+	f, err := os.Open(path)
+	if err != nil {
+		return 0, err
+	}
+	defer f.Close()
+
+	var buf [64]byte
+	n, err := f.Read(buf[:])
+	if err != nil && err != io.EOF {
+		return 0, err
+	}
+	return ParseIntBytes(buf[:n])
+}
+
+// ParseIntBytes 解析十进制整数，忽略首尾空白
+func ParseIntBytes(b []byte) (int64, error) {
+	b = bytes.TrimSpace(b)
+	if len(b) == 0 {
+		return 0, errors.New("empty integer")
+	}
+	neg := false
+	if b[0] == '-' || b[0] == '+' {
+		neg = b[0] == '-'
+		b = b[1:]
+		if len(b) == 0 {
+			return 0, errors.New("invalid integer")
+		}
+	}
+	var v int64
+	for _, c := range b {
+		if c < '0' || c > '9' {
+			return 0, &strconv.NumError{Func: "ParseIntBytes", Num: string(b), Err: strconv.ErrSyntax}
+		}
+		v = v*10 + int64(c-'0')
+	}
+	if neg {
+		v = -v
+	}
+	return v, nil
+}
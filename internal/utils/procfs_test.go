@@ -0,0 +1,146 @@
+package utils
+
+import (
+	"net"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+)
+
+func TestReadProcFile(t *testing.T) {
+	dir := t.TempDir()
+	tests := []struct {
+		name     string
+		content  string
+		sizeHint int
+	}{
+		{"小文件", "0x10de\n", 64},
+		{"恰好等于缓冲区", strings.Repeat("a", 64), 64},
+		{"超过缓冲区", strings.Repeat("model name\t: Test CPU\n", 100), 64},
+		{"空文件", "", 64},
+	}
+
+	for i, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			path := filepath.Join(dir, string(rune('a'+i)))
+			if err := os.WriteFile(path, []byte(tt.content), 0o644); err != nil {
+				t.Fatal(err)
+			}
+			data, err := ReadProcFile(path, tt.sizeHint)
+			if err != nil {
+				t.Fatalf("ReadProcFile() error = %v", err)
+			}
+			if string(data) != tt.content {
+				t.Errorf("ReadProcFile() = %q, expected %q", data, tt.content)
+			}
+		})
+	}
+}
+
+// TestReadProcFileSeqFile 在真实的 seq_file 上对比 os.ReadFile：
+// seq_file 每次 read 只返回约一页，普通文件上无法暴露短读被当作 EOF 的问题
+func TestReadProcFileSeqFile(t *testing.T) {
+	const page = 4096
+
+	// 每个监听套接字在 /proc/net/tcp 中占约 150 字节，打开足够多的监听使其超过一页
+	for i := 0; i < 64; i++ {
+		ln, err := net.Listen("tcp4", "127.0.0.1:0")
+		if err != nil {
+			break
+		}
+		defer ln.Close()
+	}
+
+	for _, path := range []string{"/proc/net/tcp", "/proc/self/mountinfo", "/proc/cpuinfo"} {
+		t.Run(path, func(t *testing.T) {
+			expected, err := os.ReadFile(path)
+			if err != nil {
+				t.Skipf("无法读取 %s: %v", path, err)
+			}
+			if len(expected) <= page {
+				t.Skipf("%s 只有 %d 字节，不足一页", path, len(expected))
+			}
+			data, err := ReadProcFile(path, 64<<10) // 与调用方相同的大缓冲区：首次 read 即为短读
+			if err != nil {
+				t.Fatalf("ReadProcFile() error = %v", err)
+			}
+			// 内容可能在两次读取之间变化，只比较行数与长度量级
+			if got, want := strings.Count(string(data), "\n"), strings.Count(string(expected), "\n"); got < want*9/10 {
+				t.Errorf("ReadProcFile(%s) 返回 %d 行（%d 字节），os.ReadFile 返回 %d 行（%d 字节）",
+					path, got, len(data), want, len(expected))
+			}
+		})
+	}
+}
+
+func TestParseIntBytes(t *testing.T) {
+	tests := []struct {
+		name     string
+		input    string
+		expected int64
+		wantErr  bool
+	}{
+		{"普通整数", "123456\n", 123456, false},
+		{"负数", "-1500000\n", -1500000, false},
+		{"带空白", "  42  ", 42, false},
+		{"空", "\n", 0, true},
+		{"非法字符", "12a", 0, true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			result, err := ParseIntBytes([]byte(tt.input))
+			if (err != nil) != tt.wantErr {
+				t.Fatalf("ParseIntBytes(%q) error = %v, wantErr %v", tt.input, err, tt.wantErr)
+			}
+			if result != tt.expected {
+				t.Errorf("ParseIntBytes(%q) = %v, expected %v", tt.input, result, tt.expected)
+			}
+		})
+	}
+}
+
+func TestProcFileCache(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "stat")
+	cache := NewProcFileCache()
+	defer cache.Close()
+
+	read := func() string {
+		var out string
+		if err := cache.Read(path, 8, func(data []byte) error {
+			out = string(data)
+			return nil
+		}); err != nil {
+			t.Fatalf("Read() error = %v", err)
+		}
+		return out
+	}
+
+	tests := []struct {
+		name    string
+		content string
+		closeFD bool
+	}{
+		{"首次读取", "cpu 1 2\n", false},
+		{"内容超过缓冲区", strings.Repeat("cpu0 1 2 3 4\n", 10), false},
+		{"内容变短", "cpu 9\n", false},
+		{"关闭后重新打开", "cpu 10\n", true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			// 原地改写而不是替换文件，模拟 /proc 文件在同一 inode 上内容变化
+			if err := os.WriteFile(path, []byte(tt.content), 0o644); err != nil {
+				t.Fatal(err)
+			}
+			if tt.closeFD {
+				cache.Close()
+			}
+			if got := read(); got != tt.content {
+				t.Errorf("Read() = %q, expected %q", got, tt.content)
+			}
+		})
+	}
+}
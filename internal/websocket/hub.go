@@ -2,6 +2,7 @@ package websocket
 
 import (
 	"context"
+	"fmt"
 	"log"
 	"sync"
 	"sync/atomic"
@@ -9,9 +10,38 @@ import (
 
 	"github.com/AnalyseDeCircuit/opskernel/internal/collectors"
 	"github.com/AnalyseDeCircuit/opskernel/internal/settings"
+	"github.com/AnalyseDeCircuit/opskernel/internal/utils"
 	"github.com/AnalyseDeCircuit/opskernel/pkg/types"
+	"github.com/gorilla/websocket"
 )
 
+// payloadCacheTTL 是广播消息的复用时间。所有订阅组合相同的客户端在此时间内
+// 共享同一份已序列化、已压缩的消息，而不是各自 Marshal 和压缩一次。
+const payloadCacheTTL = time.Second
+
+// minClientInterval/maxClientInterval 限定客户端可请求的推送间隔。
+// 采集器按所有客户端中最短的间隔运行，下限保证无论客户端传入什么 interval，
+// 服务端对 /proc 的读取频率都有上界；各客户端再由广播协程按自己的间隔抽样推送。
+const (
+	minClientInterval = 2 * time.Second
+	maxClientInterval = 60 * time.Second
+)
+
+// broadcastTick 是广播协程检查各客户端推送时间的粒度。客户端间隔最短为
+// minClientInterval，250ms 的误差对展示没有影响。
+const broadcastTick = 250 * time.Millisecond
+
+// payloadKey 描述一个客户端的订阅组合，决定其收到的消息内容
+type payloadKey struct {
+	processes string // "", "processes" 或 "top_processes"
+	netDetail bool
+}
+
+type cachedPayload struct {
+	msg     *websocket.PreparedMessage
+	builtAt time.Time
+}
+
 type netDetailSnapshot struct {
 	Network  types.NetInfo
 	SSHStats types.SSHStats
@@ -32,9 +62,14 @@ type statsHub struct {
 
 	mu             sync.Mutex
 	clientInterval map[uint64]time.Duration
+	clients        map[uint64]*Client
+	broadcastStop  chan struct{} // 非 nil 表示广播协程正在运行
 	shutdown       bool
 	ready          chan struct{}
 	alwaysOn       bool // 后台常驻模式
+
+	payloadMu sync.Mutex
+	payloads  map[payloadKey]cachedPayload
 }
 
 func newStatsHub() *statsHub {
@@ -52,6 +87,8 @@ func newStatsHub() *statsHub {
 		netDetailColl:    netDetailColl,
 		sshCollector:     sshCollector,
 		clientInterval:   make(map[uint64]time.Duration),
+		clients:          make(map[uint64]*Client),
+		payloads:         make(map[payloadKey]cachedPayload),
 		ready:            make(chan struct{}),
 		alwaysOn:         alwaysOn,
 	}
@@ -148,6 +185,10 @@ func (h *statsHub) Shutdown() {
 		return
 	}
 	h.shutdown = true
+	if h.broadcastStop != nil {
+		close(h.broadcastStop)
+		h.broadcastStop = nil
+	}
 	h.mu.Unlock()
 
 	log.Println("statsHub: shutting down all collectors...")
@@ -167,13 +208,22 @@ func (h *statsHub) Shutdown() {
 	log.Println("statsHub: all collectors have been stopped successfully")
 }
 
-func (h *statsHub) RegisterClient(id uint64, interval time.Duration) {
+// RegisterClient 登记客户端，由广播协程按其间隔推送数据（首次推送立即进行）
+func (h *statsHub) RegisterClient(id uint64, c *Client, interval time.Duration) {
 	interval = clampInterval(interval)
+	c.interval = interval
+	c.nextSend = time.Now()
+
 	h.mu.Lock()
 	wasEmpty := len(h.clientInterval) == 0
 	h.clientInterval[id] = interval
+	h.clients[id] = c
 	min := minIntervalLocked(h.clientInterval)
 	alwaysOn := h.alwaysOn
+	if h.broadcastStop == nil && !h.shutdown {
+		h.broadcastStop = make(chan struct{})
+		go h.broadcastLoop(h.broadcastStop)
+	}
 	h.mu.Unlock()
 
 	// 按需模式下，第一个客户端连接时启动采集器
@@ -187,9 +237,14 @@ func (h *statsHub) RegisterClient(id uint64, interval time.Duration) {
 func (h *statsHub) UnregisterClient(id uint64) {
 	h.mu.Lock()
 	delete(h.clientInterval, id)
+	delete(h.clients, id)
 	isEmpty := len(h.clientInterval) == 0
 	min := minIntervalLocked(h.clientInterval)
 	alwaysOn := h.alwaysOn
+	if isEmpty && h.broadcastStop != nil {
+		close(h.broadcastStop)
+		h.broadcastStop = nil
+	}
 	h.mu.Unlock()
 
 	// 按需模式下，最后一个客户端断开时停止采集器
@@ -201,6 +256,44 @@ func (h *statsHub) UnregisterClient(id uint64) {
 	}
 }
 
+// broadcastLoop 是唯一的推送协程：每个 broadcastTick 找出到期的客户端，
+// 按订阅组合取共享的已编码消息（同一组合只构建一次）并投递到各自的发送队列。
+// 取代了每个连接各自一个 ticker 协程的做法。
+func (h *statsHub) broadcastLoop(stop chan struct{}) {
+	ticker := time.NewTicker(broadcastTick)
+	defer ticker.Stop()
+
+	var due []*Client
+	for {
+		select {
+		case <-stop:
+			return
+		case <-h.ready:
+		}
+
+		now := time.Now()
+		due = due[:0]
+		h.mu.Lock()
+		for _, c := range h.clients {
+			if !now.Before(c.nextSend) {
+				c.nextSend = now.Add(c.interval)
+				due = append(due, c)
+			}
+		}
+		h.mu.Unlock()
+
+		for _, c := range due {
+			c.sendData()
+		}
+
+		select {
+		case <-stop:
+			return
+		case <-ticker.C:
+		}
+	}
+}
+
 func (h *statsHub) Subscribe(topic string) {
 	switch topic {
 	case "processes", "top_processes":
@@ -247,6 +340,73 @@ func (h *statsHub) LatestBase() (types.Response, bool) {
 	return h.aggregator.CollectBaseStats(), true
 }
 
+// payloadKeyFor 将客户端订阅集合归一化为 payloadKey
+func payloadKeyFor(subs map[string]bool) payloadKey {
+	var key payloadKey
+	// "processes" = full list (triggers collection), "top_processes" = top 10 only (lightweight)
+	if subs["processes"] {
+		key.processes = "processes"
+	} else if subs["top_processes"] {
+		key.processes = "top_processes"
+	}
+	key.netDetail = subs["net_detail"]
+	return key
+}
+
+// Payload returns the encoded message for a subscription combination. The
+// message is built at most once per payloadCacheTTL and shared by every
+// client with the same subscriptions; gorilla's PreparedMessage also caches
+// the compressed frame, so permessage-deflate runs once per broadcast.
+func (h *statsHub) Payload(key payloadKey) (*websocket.PreparedMessage, error) {
+	h.payloadMu.Lock()
+	defer h.payloadMu.Unlock()
+
+	if cached, ok := h.payloads[key]; ok && time.Since(cached.builtAt) < payloadCacheTTL {
+		return cached.msg, nil
+	}
+
+	data, err := utils.MarshalJSON(h.buildResponse(key))
+	if err != nil {
+		return nil, fmt.Errorf("marshal error: %w", err)
+	}
+	msg, err := websocket.NewPreparedMessage(websocket.TextMessage, data)
+	if err != nil {
+		return nil, fmt.Errorf("prepare message: %w", err)
+	}
+	h.payloads[key] = cachedPayload{msg: msg, builtAt: time.Now()}
+	return msg, nil
+}
+
+// buildResponse merges base stats with the topic data selected by key
+func (h *statsHub) buildResponse(key payloadKey) types.Response {
+	resp, _ := h.LatestBase()
+
+	switch key.processes {
+	case "processes":
+		if procs, ok := h.LatestProcesses(); ok {
+			resp.Processes = procs
+		}
+	case "top_processes":
+		if procs, ok := h.LatestTopProcesses(10); ok {
+			resp.Processes = procs
+		}
+	}
+
+	if key.netDetail {
+		if netDetail, ok := h.LatestNetDetail(); ok {
+			// Merge network detail into base network data (preserve BytesSent/BytesRecv/RawSent/RawRecv)
+			resp.Network.Interfaces = netDetail.Network.Interfaces
+			resp.Network.Sockets = netDetail.Network.Sockets
+			resp.Network.ConnectionStates = netDetail.Network.ConnectionStates
+			resp.Network.Errors = netDetail.Network.Errors
+			resp.Network.ListeningPorts = netDetail.Network.ListeningPorts
+			resp.SSHStats = netDetail.SSHStats
+		}
+	}
+
+	return resp
+}
+
 func (h *statsHub) LatestProcesses() ([]types.ProcessInfo, bool) {
 	return h.processes.Latest()
 }
@@ -386,11 +546,11 @@ func (c *conditionalCollector[T]) Latest() (T, bool) {
 // ========== Helpers ==========
 
 func clampInterval(d time.Duration) time.Duration {
-	if d < 2*time.Second {
-		d = 2 * time.Second
+	if d < minClientInterval {
+		d = minClientInterval
 	}
-	if d > 60*time.Second {
-		d = 60 * time.Second
+	if d > maxClientInterval {
+		d = maxClientInterval
 	}
 	return d
 }
@@ -32,16 +32,27 @@ const (
 
 	wsMsgRatePerSec = 2.0
 	wsMsgBurst      = 5.0
+
+	// wsSendQueueSize 是每个客户端的发送队列长度。每条消息都是完整快照，
+	// 积压的旧快照没有价值，队列保持很短，溢出时丢弃最旧的一条。
+	wsSendQueueSize = 16
+	// wsMaxSendOverflows 是发送队列连续溢出的次数上限，超过后断开该客户端
+	wsMaxSendOverflows = 3
 )
 
 // Client 代表一个 WebSocket 客户端连接
 type Client struct {
 	hub  *statsHub
 	conn *websocket.Conn
-	send chan []byte
+	send chan *websocket.PreparedMessage
 	done chan struct{} // closed when connection ends
 	subs map[string]bool
 	mu   sync.Mutex
+
+	// 以下字段仅由 hub 的广播协程访问（interval 在登记时写入）
+	interval  time.Duration
+	nextSend  time.Time
+	overflows int // 发送队列连续溢出次数
 }
 
 // Shutdown gracefully stops the WebSocket hub and all collectors.
@@ -58,7 +69,7 @@ var Upgrader = websocket.Upgrader{
 		return isAllowedWebSocketOrigin(r)
 	},
 	// 启用 WebSocket 压缩扩展 (permessage-deflate)
-	// 可减少 60-70% 的网络传输量
+	// 可减少 60-70% 的网络传输量；广播消息通过 PreparedMessage 只压缩一次
 	EnableCompression: true,
 }
 
@@ -231,11 +242,11 @@ func HandleWebSocket(w http.ResponseWriter, r *http.Request) {
 
 	intervalStr := r.URL.Query().Get("interval")
 	interval, err := strconv.ParseFloat(intervalStr, 64)
-	if err != nil || interval < 2.0 {
-		interval = 2.0
+	if err != nil || interval < minClientInterval.Seconds() {
+		interval = minClientInterval.Seconds()
 	}
-	if interval > 60 {
-		interval = 60
+	if interval > maxClientInterval.Seconds() {
+		interval = maxClientInterval.Seconds()
 	}
 
 	clientInterval := time.Duration(interval * float64(time.Second))
@@ -246,17 +257,17 @@ func HandleWebSocket(w http.ResponseWriter, r *http.Request) {
 	client := &Client{
 		hub:  wsHub,
 		conn: c,
-		send: make(chan []byte, 256),
+		send: make(chan *websocket.PreparedMessage, wsSendQueueSize),
 		done: make(chan struct{}),
 		subs: map[string]bool{"base": true},
 	}
 
-	wsHub.RegisterClient(clientID, clientInterval)
+	// Data is pushed by the hub's broadcaster; the first push happens on its next tick
+	wsHub.RegisterClient(clientID, client, clientInterval)
 
 	// Start pumps
 	go client.writePump()
 	go client.readPump(r, clientID)
-	go client.dataPump(clientInterval)
 }
 
 // readPump pumps messages from the websocket connection to the hub.
@@ -273,7 +284,7 @@ func (c *Client) readPump(r *http.Request, clientID uint64) {
 		c.subs = map[string]bool{"base": true}
 		c.mu.Unlock()
 
-		close(c.done) // signal dataPump and writePump to stop
+		close(c.done) // signal writePump to stop
 		c.hub.UnregisterClient(clientID)
 		c.conn.Close()
 	}()
@@ -366,13 +377,7 @@ func (c *Client) writePump() {
 				return
 			}
 
-			w, err := c.conn.NextWriter(websocket.TextMessage)
-			if err != nil {
-				return
-			}
-			w.Write(message)
-
-			if err := w.Close(); err != nil {
+			if err := c.conn.WritePreparedMessage(message); err != nil {
 				return
 			}
 
@@ -385,77 +390,45 @@ func (c *Client) writePump() {
 	}
 }
 
-// dataPump periodically fetches data from hub and sends to client
-func (c *Client) dataPump(interval time.Duration) {
-	ticker := time.NewTicker(interval)
-	defer ticker.Stop()
-
-	// Wait for hub to be ready
-	c.hub.WaitReady(5 * time.Second)
-
-	// Send initial data immediately
-	c.sendData()
-
-	for {
-		select {
-		case <-c.done:
-			return
-		case <-ticker.C:
-			c.sendData()
-		}
-	}
-}
-
 // sendData fetches latest data from hub and sends to client
 func (c *Client) sendData() {
 	c.mu.Lock()
-	subs := make(map[string]bool)
-	for k, v := range c.subs {
-		subs[k] = v
-	}
+	key := payloadKeyFor(c.subs)
 	c.mu.Unlock()
 
-	// Build response based on subscriptions
-	resp, ok := c.hub.LatestBase()
-	if !ok {
+	msg, err := c.hub.Payload(key)
+	if err != nil {
+		log.Printf("broadcast: %v", err)
 		return
 	}
+	c.enqueue(msg)
+}
 
-	// Add processes if subscribed
-	// "processes" = full list (triggers collection), "top_processes" = top 10 only (lightweight)
-	if subs["processes"] {
-		if procs, ok := c.hub.LatestProcesses(); ok {
-			resp.Processes = procs
-		}
-	} else if subs["top_processes"] {
-		if procs, ok := c.hub.LatestTopProcesses(10); ok {
-			resp.Processes = procs
-		}
-	}
-
-	// Add network detail if subscribed
-	if subs["net_detail"] {
-		if netDetail, ok := c.hub.LatestNetDetail(); ok {
-			// Merge network detail into base network data (preserve BytesSent/BytesRecv/RawSent/RawRecv)
-			resp.Network.Interfaces = netDetail.Network.Interfaces
-			resp.Network.Sockets = netDetail.Network.Sockets
-			resp.Network.ConnectionStates = netDetail.Network.ConnectionStates
-			resp.Network.Errors = netDetail.Network.Errors
-			resp.Network.ListeningPorts = netDetail.Network.ListeningPorts
-			resp.SSHStats = netDetail.SSHStats
-		}
+// enqueue 非阻塞地投递一条消息。队列已满（客户端过慢）时丢弃最旧的消息，
+// 保证客户端最终收到的是最新快照，而不是停留在积压的旧数据上。
+// 连续多次溢出说明该客户端已无法跟上（僵尸连接），直接断开，
+// 由 readPump 负责注销与清理，避免其长期占用 hub 资源。
+func (c *Client) enqueue(data *websocket.PreparedMessage) {
+	select {
+	case c.send <- data:
+		c.overflows = 0
+		return
+	default:
 	}
 
-	data, err := json.Marshal(resp)
-	if err != nil {
-		log.Printf("dataPump: marshal error: %v", err)
+	c.overflows++
+	if c.overflows >= wsMaxSendOverflows {
+		log.Printf("ws client send queue overflowed %d times in a row, closing connection remote=%q", c.overflows, c.conn.RemoteAddr())
+		c.conn.Close()
 		return
 	}
 
-	// Non-blocking send to avoid blocking if client is slow
+	select {
+	case <-c.send:
+	default:
+	}
 	select {
 	case c.send <- data:
 	default:
-		// Channel full, skip this update
 	}
 }
@@ -308,6 +308,9 @@ type DiskIOInfo struct {
 	WriteCount uint64 `json:"write_count"`
 	ReadTime   uint64 `json:"read_time"`
 	WriteTime  uint64 `json:"write_time"`
+	// 与上一次采样相比的读写速率（字节/秒），首次采样为 0
+	ReadRate  float64 `json:"read_rate"`
+	WriteRate float64 `json:"write_rate"`
 }
 
 // InodeInfo Inode信息
@@ -356,12 +359,13 @@ type Interface struct {
 	BytesRecv string  `json:"bytes_recv"`
 	RawSent   uint64  `json:"raw_sent"`
 	RawRecv   uint64  `json:"raw_recv"`
-	Speed     float64 `json:"speed"`
+	Speed     float64 `json:"speed,omitempty"`
 	IsUp      bool    `json:"is_up"`
-	ErrorsIn  uint64  `json:"errors_in"`
-	ErrorsOut uint64  `json:"errors_out"`
-	DropsIn   uint64  `json:"drops_in"`
-	DropsOut  uint64  `json:"drops_out"`
+	// 错误/丢包计数绝大多数时候为 0，省略零值可去掉每个网卡四个重复的键
+	ErrorsIn  uint64 `json:"errors_in,omitempty"`
+	ErrorsOut uint64 `json:"errors_out,omitempty"`
+	DropsIn   uint64 `json:"drops_in,omitempty"`
+	DropsOut  uint64 `json:"drops_out,omitempty"`
 }
 
 // ListeningPort 监听端口信息
@@ -403,7 +407,7 @@ type ProcessInfo struct {
 	PPID          int32         `json:"ppid"`
 	Uptime        string        `json:"uptime"`
 	Cmdline       string        `json:"cmdline"`
-	Cwd           string        `json:"cwd"`
+	Cwd           string        `json:"cwd,omitempty"` // 列表中不采集，详情通过 /api/process/io 按需读取
 	IORead        string        `json:"io_read"`
 	IOWrite       string        `json:"io_write"`
 	Children      []ProcessInfo `json:"children,omitempty"`
@@ -462,10 +466,12 @@ func (p ProcessInfo) MarshalJSON() ([]byte, error) {
 	cmdBytes, _ := json.Marshal(p.Cmdline)
 	buf = append(buf, cmdBytes...)
 
-	// Cwd
-	buf = append(buf, `,"cwd":`...)
-	cwdBytes, _ := json.Marshal(p.Cwd)
-	buf = append(buf, cwdBytes...)
+	// Cwd (omitempty)
+	if p.Cwd != "" {
+		buf = append(buf, `,"cwd":`...)
+		cwdBytes, _ := json.Marshal(p.Cwd)
+		buf = append(buf, cwdBytes...)
+	}
 
 	// IORead
 	buf = append(buf, `,"io_read":`...)
@@ -141,24 +141,33 @@ function renderProcessTree(processes) {
         return;
     }
 
-    const pidMap = {};
+    // One pass: group children by ppid in a side map instead of mutating
+    // every process object, and keep a Set of pids for root detection.
+    const pids = new Set();
+    const childrenByPpid = new Map();
     processes.forEach((p) => {
-        pidMap[p.pid] = p;
+        pids.add(p.pid);
+        const siblings = childrenByPpid.get(p.ppid);
+        if (siblings) {
+            siblings.push(p);
+        } else {
+            childrenByPpid.set(p.ppid, [p]);
+        }
     });
 
-    const rootProcesses = processes.filter((p) => !pidMap[p.ppid]);
-
     // Use DocumentFragment to minimize reflows
     const fragment = document.createDocumentFragment();
-    rootProcesses.forEach((root) => {
-        renderProcessTreeNode(root, processes, pidMap, 0, fragment);
+    processes.forEach((p) => {
+        if (!pids.has(p.ppid) || p.ppid === p.pid) {
+            renderProcessTreeNode(p, childrenByPpid, 0, fragment);
+        }
     });
 
     container.innerHTML = '';
     container.appendChild(fragment);
 }
 
-function renderProcessTreeNode(proc, allProcs, pidMap, level, container) {
+function renderProcessTreeNode(proc, childrenByPpid, level, container) {
     const div = document.createElement('div');
     div.className = `process-item level-${Math.min(level, 4)}`;
     div.style.cursor = 'pointer';
@@ -171,9 +180,10 @@ function renderProcessTreeNode(proc, allProcs, pidMap, level, container) {
     const role = localStorage.getItem('role');
     const isAdmin = role === 'admin';
 
-    const hasChildren = proc.children && proc.children.length > 0;
+    const children = proc.pid !== proc.ppid ? childrenByPpid.get(proc.pid) : undefined;
+    const hasChildren = !!children && children.length > 0;
     const expandIcon = hasChildren
-        ? '<i class="fas fa-chevron-right" style="margin-right: 5px; transition: transform 0.2s;"></i>'
+        ? '<i class="fas fa-chevron-right" style="margin-right: 5px; transition: transform 0.2s; transform: rotate(90deg);"></i>'
         : '<span style="margin-right: 5px; display: inline-block; width: 16px;"></span>';
 
     div.innerHTML = `
@@ -222,12 +232,12 @@ function renderProcessTreeNode(proc, allProcs, pidMap, level, container) {
 
     container.appendChild(div);
 
-    if (hasChildren && proc.children) {
+    if (hasChildren) {
         const childrenContainer = document.createElement('div');
         childrenContainer.className = 'children-group';
 
-        proc.children.forEach((child) => {
-            renderProcessTreeNode(child, allProcs, pidMap, level + 1, childrenContainer);
+        children.forEach((child) => {
+            renderProcessTreeNode(child, childrenByPpid, level + 1, childrenContainer);
         });
 
         container.appendChild(childrenContainer);
@@ -291,9 +301,7 @@ function showProcDetail(pid) {
         </div>
         <div style="margin-top: 15px;">
             <div style="font-size: 0.8rem; color: var(--text-dim); margin-bottom: 5px;">Working Directory</div>
-            <div class="mono-text" style="background: rgba(0,0,0,0.3); padding: 10px; border-radius: 4px; font-size: 0.85rem; word-break: break-all;">
-                ${(proc.cwd || '-').replace(/</g, '&lt;').replace(/>/g, '&gt;')}
-            </div>
+            <div id="proc-cwd" class="mono-text" style="background: rgba(0,0,0,0.3); padding: 10px; border-radius: 4px; font-size: 0.85rem; word-break: break-all;">Loading...</div>
         </div>
         <div id="proc-io-container" style="margin-top: 15px; display: grid; grid-template-columns: 1fr 1fr; gap: 10px;">
             <div>
@@ -317,27 +325,31 @@ function showProcDetail(pid) {
 
     modal.style.display = 'flex';
 
-    // Lazy-load IO data (reduces CPU overhead by ~30-40%)
+    // Lazy-load IO data and cwd (reduces CPU overhead by ~30-40%)
     fetchProcessIO(proc.pid);
 }
 
 async function fetchProcessIO(pid) {
     const ioReadEl = document.getElementById('proc-io-read');
     const ioWriteEl = document.getElementById('proc-io-write');
+    const cwdEl = document.getElementById('proc-cwd');
 
     try {
         const response = await fetch(`/api/process/io?pid=${pid}`);
         if (!response.ok) {
             ioReadEl.innerText = '-';
             ioWriteEl.innerText = '-';
+            cwdEl.innerText = '-';
             return;
         }
         const data = await response.json();
         ioReadEl.innerText = data.io_read || '-';
         ioWriteEl.innerText = data.io_write || '-';
+        cwdEl.innerText = data.cwd || '-';
     } catch (err) {
         ioReadEl.innerText = '-';
         ioWriteEl.innerText = '-';
+        cwdEl.innerText = '-';
     }
 }
 
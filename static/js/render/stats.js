@@ -700,12 +700,15 @@ function _renderStatsInternal(data) {
                 if (data.power.percent !== undefined) {
                     powerList.push({type: 'battery', ...data.power});
                 }
-                if (data.power.consumption_watts !== undefined) {
-                    powerList.push({type: 'total', watts: data.power.consumption_watts});
+                // Prefer the smoothed averages for display; fall back to the raw readings
+                const totalWatts = data.power.consumption_watts_avg !== undefined ? data.power.consumption_watts_avg : data.power.consumption_watts;
+                const raplWatts = data.power.rapl_avg || data.power.rapl;
+                if (totalWatts !== undefined) {
+                    powerList.push({type: 'total', watts: totalWatts});
                 }
-                if (data.power.rapl) {
-                    for (const [domain, watts] of Object.entries(data.power.rapl)) {
-                        if (domain.includes('Package') && data.power.consumption_watts == watts) continue;
+                if (raplWatts) {
+                    for (const [domain, watts] of Object.entries(raplWatts)) {
+                        if (domain.includes('Package') && totalWatts == watts) continue;
                         powerList.push({type: 'rapl', domain: domain, watts: watts});
                     }
                 }
@@ -858,7 +861,7 @@ function _renderStatsInternal(data) {
                             errorContainer.innerHTML = '<div style="grid-column: 1 / -1; text-align: center; color: var(--text-dim); padding: 10px;">No errors or drops detected</div>';
                         } else {
                             errorContainer.innerHTML = interfaces.map(iface => `
-                                <div style="padding: 10px; background: rgba(255,255,255,0.03); border-radius: 4px; border-left: 3px solid ${(iface.errors_in + iface.errors_out) > 0 ? '#ff6b6b' : '#ffa94d'};">
+                                <div style="padding: 10px; background: rgba(255,255,255,0.03); border-radius: 4px; border-left: 3px solid ${((iface.errors_in || 0) + (iface.errors_out || 0)) > 0 ? '#ff6b6b' : '#ffa94d'};">
                                     <div style="font-weight: bold; margin-bottom: 5px;">${iface.name}</div>
                                     <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 5px; font-size: 0.85rem;">
                                         <div style="color: var(--text-dim);">Errors In: <span style="color: #ff6b6b; font-weight: bold;">${iface.errors_in || 0}</span></div>
@@ -923,8 +926,8 @@ function _renderStatsInternal(data) {
                             
                             el.querySelector('.iface-ip').innerText = iface.ip;
                             el.querySelector('.iface-speed').innerText = iface.speed > 0 ? iface.speed + ' Mb/s' : 'N/A';
-                            el.querySelector('.iface-sent').innerText = iface.bytes_sent;
-                            el.querySelector('.iface-recv').innerText = iface.bytes_recv;
+                            el.querySelector('.iface-sent').innerText = formatSize(iface.raw_sent || 0);
+                            el.querySelector('.iface-recv').innerText = formatSize(iface.raw_recv || 0);
                         }
                     );
                 }
@@ -1161,8 +1164,8 @@ function _renderStatsInternal(data) {
                             <div class="process-info">
                                 <div class="process-name">${io.name}</div>
                                 <div class="process-meta">
-                                    Read: ${io.read_bytes} (${io.read_count.toLocaleString()} ops) • 
-                                    Write: ${io.write_bytes} (${io.write_count.toLocaleString()} ops)
+                                    Read: ${io.read_bytes} (${io.read_count.toLocaleString()} ops, ${formatSize(Math.round(io.read_rate || 0))}/s) • 
+                                    Write: ${io.write_bytes} (${io.write_count.toLocaleString()} ops, ${formatSize(Math.round(io.write_rate || 0))}/s)
                                 </div>
                             </div>
                             <div class="process-bars" style="display: flex; gap: 15px; align-items: center;">